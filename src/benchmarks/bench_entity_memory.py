@@ -0,0 +1,130 @@
+"""Per-entity memory and move throughput for swarm-sized waves.
+
+Run from ``src/``: ``python -m benchmarks.bench_entity_memory``
+
+Creates 100k enemies and 10k projectiles and reports bytes per entity and
+moves per second per layout: "dict" rebuilds the classes without
+``__slots__`` (the layout entities had before they were slotted), "slots" is
+the current ``Enemy``/``Projectile``, and "store" is the array-backed
+``EnemyStore`` used by vectorized simulations, with "row" counting its
+numpy columns alone (no ``EnemyView`` proxies).
+"""
+import gc
+import random
+import time
+import tracemalloc
+
+from enemies.enemy import Enemy
+from enemies.enemy_store import EnemyStore
+from game.entity_registry import EntityRegistry
+from game.game_map import GameMap
+from turrets.turret import Projectile
+
+ENEMY_COUNT = 100_000
+PROJECTILE_COUNT = 10_000
+MOVE_TICKS = 5
+DT = 1 / 60
+
+
+def unslotted(cls: type) -> type:
+    # Same methods and properties, but instances get a __dict__ again
+    namespace = {
+        name: value for name, value in vars(cls).items()
+        if name not in ('__slots__', '__dict__', '__weakref__') and name not in cls.__slots__
+    }
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+def measure(factory, count: int) -> tuple[list, float]:
+    """Build ``count`` entities and return them with the bytes each one costs.
+
+    Tracing is started by the caller before any setup, so blocks resized
+    while building (e.g. registry tables) count only their growth, and is
+    stopped before timing moves.
+    """
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    # The list holding them is bookkeeping, not entity storage
+    return entities, (after - before - entities.__sizeof__()) / count
+
+
+def moves_per_second(move, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(MOVE_TICKS):
+        move()
+    return count * MOVE_TICKS / (time.perf_counter() - start)
+
+
+def bench_enemies(enemy_cls: type, path, rng: random.Random) -> tuple[float, float, list]:
+    def make(_):
+        enemy = enemy_cls(path, 1, 100, 10, (0, 0, 255), 10)
+        enemy.distance = rng.uniform(0, path.length / 2)
+        return enemy
+
+    tracemalloc.start()
+    enemies, size = measure(make, ENEMY_COUNT)
+    tracemalloc.stop()
+
+    def move():
+        for enemy in enemies:
+            enemy.move(DT)
+
+    return size, moves_per_second(move, ENEMY_COUNT), enemies
+
+
+def bench_store(path, enemies: list) -> tuple[float, float, float]:
+    """Bytes per row of the columns alone, bytes per enemy including its view, moves/s."""
+    gc.collect()
+    tracemalloc.start()
+    store = EnemyStore(path, capacity=ENEMY_COUNT)
+    for enemy in enemies:
+        store.add(enemy)
+    store.views()
+    size = tracemalloc.get_traced_memory()[0] / ENEMY_COUNT
+    tracemalloc.stop()
+    columns = sum(getattr(store, name).nbytes for name in store._columns()) / store.capacity
+    return columns, size, moves_per_second(lambda: store.move(DT), ENEMY_COUNT)
+
+
+def bench_projectiles(projectile_cls: type, targets: list) -> tuple[float, float]:
+    tracemalloc.start()
+    registry = EntityRegistry()
+    for target in targets:
+        registry.register(target)
+    projectiles, size = measure(
+        lambda i: projectile_cls(0, 0, targets[i % len(targets)], 10, registry), PROJECTILE_COUNT
+    )
+    tracemalloc.stop()
+    for projectile in projectiles:
+        projectile.speed = 0.001  # Keep them in flight for the whole run
+
+    def move():
+        for projectile in projectiles:
+            projectile.move(DT)
+
+    return size, moves_per_second(move, PROJECTILE_COUNT)
+
+
+def main():
+    path = GameMap(random.Random(0)).path
+    rows = []
+    dict_size, dict_rate, _ = bench_enemies(unslotted(Enemy), path, random.Random(0))
+    rows.append(('enemy', 'dict', dict_size, dict_rate))
+    slot_size, slot_rate, enemies = bench_enemies(Enemy, path, random.Random(0))
+    rows.append(('enemy', 'slots', slot_size, slot_rate))
+    columns, store_size, store_rate = bench_store(path, enemies)
+    rows.append(('enemy', 'store', store_size, store_rate))
+    rows.append(('enemy', 'row', columns, store_rate))
+    rows.append(('projectile', 'dict', *bench_projectiles(unslotted(Projectile), enemies)))
+    rows.append(('projectile', 'slots', *bench_projectiles(Projectile, enemies)))
+
+    print(f"{ENEMY_COUNT} enemies, {PROJECTILE_COUNT} projectiles, {MOVE_TICKS} ticks")
+    print(f"{'entity':>10} {'layout':>6} {'bytes':>8} {'moves/s':>12}")
+    for entity, layout, size, rate in rows:
+        print(f"{entity:>10} {layout:>6} {size:>8.0f} {rate:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Brute-force vs spatial-hash vs path-coverage vs distance-matrix targeting.
+
+Run from ``src/``: ``python -m benchmarks.bench_targeting``
+
+Prints the time per tick for every turret to collect the enemies in its range,
+for a grid of turret and enemy counts, and marks which scan wins. The
+index columns include their once-per-tick rebuild. ``sqrt`` is the
+original per-pair ``math.sqrt`` loop the turrets used before any of
+this, ``brute`` is today's squared-distance ``enemies_in_range``, and
+``progress`` is the ``ProgressIndex`` that ``target_index='auto'`` uses.
+"""
+import math
+import random
+import timeit
+
+from enemies.enemy import DynamicEnemy
+from game.coverage_index import CoverageIndex
+from game.distance_matrix import DistanceMatrix
+from game.game_map import GameMap
+from game.progress_index import ProgressIndex
+from game.spatial_hash import SpatialHash
+from turrets import BulletTurret
+
+TURRET_COUNTS = [1, 5, 10, 20, 40, 80]
+ENEMY_COUNTS = [10, 50, 200, 1000]
+
+
+def make_enemies(game_map: GameMap, count: int, rng: random.Random) -> list:
+    enemies = []
+    for _ in range(count):
+        enemy = DynamicEnemy(game_map.path, 1, 100, 10, (0, 0, 255), 10)
+        enemy.distance = rng.uniform(0, game_map.path.length)
+        enemies.append(enemy)
+    return enemies
+
+
+def make_turrets(game_map: GameMap, count: int, rng: random.Random) -> list:
+    # Free cells next to the road, where real players build
+    cells = []
+    for px, py in game_map.path:
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1)):
+            x, y = px + dx * game_map.grid_size, py + dy * game_map.grid_size
+            if game_map.is_valid_placement(x, y) and (x, y) not in cells:
+                cells.append((x, y))
+    rng.shuffle(cells)
+    turrets = [BulletTurret(*cells[i % len(cells)]) for i in range(count)]
+    for turret in turrets:
+        turret.set_path(game_map.path)
+    return turrets
+
+
+def sqrt_scan(turrets, enemies):
+    for turret in turrets:
+        [
+            enemy for enemy in enemies
+            if math.sqrt((enemy.pos[0] - turret.pos[0]) ** 2 + (enemy.pos[1] - turret.pos[1]) ** 2)
+            <= turret.range
+        ]
+
+
+def brute_force(turrets, enemies):
+    for turret in turrets:
+        turret.enemies_in_range(enemies)
+
+
+def spatial_hash(index, turrets, enemies):
+    index.rebuild(enemies)
+    for turret in turrets:
+        turret.enemies_in_range(index)
+
+
+def path_coverage(index, path, turrets, enemies):
+    index.rebuild(enemies, path)
+    for turret in turrets:
+        turret.enemies_in_range(index)
+
+
+def distance_matrix(index, turrets, enemies):
+    index.rebuild(enemies, turrets)
+    for turret in turrets:
+        turret.enemies_in_range(index)
+
+
+def main():
+    rng = random.Random(0)
+    game_map = GameMap(random.Random(0))
+    index = SpatialHash(game_map.grid_size)
+    coverage_index = CoverageIndex()
+    progress_index = ProgressIndex()
+    matrix = DistanceMatrix()
+    print(
+        f"{'turrets':>8} {'enemies':>8} {'sqrt us':>10} {'brute us':>10} {'hash us':>10}"
+        f" {'cover us':>10} {'progress us':>12} {'matrix us':>10}  winner"
+    )
+    for enemy_count in ENEMY_COUNTS:
+        enemies = make_enemies(game_map, enemy_count, rng)
+        for turret_count in TURRET_COUNTS:
+            turrets = make_turrets(game_map, turret_count, rng)
+            number = max(1, 20000 // (turret_count * enemy_count))
+            baseline = min(timeit.repeat(lambda: sqrt_scan(turrets, enemies), number=number, repeat=3)) / number
+            brute = min(timeit.repeat(lambda: brute_force(turrets, enemies), number=number, repeat=3)) / number
+            hashed = min(timeit.repeat(lambda: spatial_hash(index, turrets, enemies), number=number, repeat=3)) / number
+            covered = min(timeit.repeat(
+                lambda: path_coverage(coverage_index, game_map.path, turrets, enemies), number=number, repeat=3
+            )) / number
+            ordered = min(timeit.repeat(
+                lambda: path_coverage(progress_index, game_map.path, turrets, enemies), number=number, repeat=3
+            )) / number
+            batched = min(timeit.repeat(lambda: distance_matrix(matrix, turrets, enemies), number=number, repeat=3)) / number
+            timings = {
+                'sqrt': baseline, 'brute': brute, 'hash': hashed,
+                'coverage': covered, 'progress': ordered, 'matrix': batched,
+            }
+            winner = min(timings, key=timings.get)
+            print(
+                f"{turret_count:>8} {enemy_count:>8} {baseline * 1e6:>10.1f} {brute * 1e6:>10.1f}"
+                f" {hashed * 1e6:>10.1f} {covered * 1e6:>10.1f} {ordered * 1e6:>12.1f} {batched * 1e6:>10.1f}  {winner}"
+            )
+
+
+if __name__ == '__main__':
+    main()
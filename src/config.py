@@ -14,3 +14,11 @@ BLACK = (0, 0, 0)
 YELLOW = (255, 255, 0)
 
 STARTING_GOLD = 100
+
+# Redraw and push only the regions that changed each frame instead of
+# flipping the whole screen; helps most on large, software-rendered windows
+DIRTY_RECTS = False
+
+# Largest turret x enemy distance matrix (in bytes) built in one go before
+# the batched range test falls back to chunks of turrets
+DISTANCE_MATRIX_BUDGET = 8 * 1024 * 1024
@@ -1,6 +1,8 @@
 from abc import ABC
 
-import pygame
+from config import FPS
+from enemies.sprites import HEALTH_BAR_OFFSET, HEALTH_BAR_WIDTH, draw_sprites, enemy_sprites, health_bar
+from game.path import ArcPath, compile_path
 
 WHITE = (255, 255, 255)
 GREEN = (34, 177, 76)
@@ -14,6 +16,13 @@ PURPLE = (160, 32, 240)
 
 
 class Enemy(ABC):
+    # Slotted so that swarm waves of 100k enemies carry no per-instance __dict__
+    __slots__ = (
+        'path', 'distance', '_pos', '_pos_distance', 'base_speed', 'speed', 'health',
+        'max_health', 'size', 'color', 'gold_value', 'score_value', 'reached_end', 'damage',
+        'handle',
+    )
+
     def __init__(
         self,
         path: list[tuple[int, int]],
@@ -24,9 +33,10 @@ class Enemy(ABC):
         gold_value: int,
         score_value: int = None,
     ):
-        self.path = path
-        self.path_index = 0
-        self.pos = list(self.path[self.path_index])
+        self.path: ArcPath = compile_path(path)
+        self.distance = 0.0  # Arc length travelled along the path
+        self._pos = self.path[0]
+        self._pos_distance = 0.0  # Distance at which _pos was last interpolated
         self.base_speed = speed  # Store base speed
         self.speed = speed      # Current speed that can be modified
         self.health = health
@@ -38,85 +48,99 @@ class Enemy(ABC):
         self.score_value = score_value if score_value is not None else gold_value
         self.reached_end = False
         self.damage = 10  # Damage dealt to player when reaching the end
-
-    def move(self):
-        if self.path_index < len(self.path) - 1:
-            next_pos = self.path[self.path_index + 1]
-            dx, dy = next_pos[0] - self.pos[0], next_pos[1] - self.pos[1]
-            dist = (dx**2 + dy**2) ** 0.5
-            if dist < self.speed:
-                self.path_index += 1
-            else:
-                self.pos[0] += self.speed * dx / dist
-                self.pos[1] += self.speed * dy / dist
-        elif not self.reached_end:  # Only set once when reaching the end
+        self.handle: int | None = None  # Set by EntityRegistry.register
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        # Interpolated lazily, only when something actually needs x/y
+        if self._pos_distance != self.distance:
+            self._pos = self.path.position_at(self.distance)
+            self._pos_distance = self.distance
+        return self._pos
+
+    @property
+    def path_index(self) -> int:
+        return self.path.segment_index(self.distance)
+
+    def move(self, dt: float = 1 / FPS):
+        # Speed is expressed in pixels per frame at the reference FPS
+        self.distance += self.speed * dt * FPS
+        if self.distance >= self.path.length:
+            self.distance = self.path.length
             self.reached_end = True
 
-    def draw_health_bar(self, screen: pygame.Surface):
-        """Draw a simple health bar above the boss."""
-        bar_width = 50
-        bar_height = 5
-        offset_y = 25  # how far above the boss circle to draw the bar
-
-        # Compute how full the bar should be
-        health_ratio = self.health / self.max_health
-        # Where to draw the bar
-        bar_x = int(self.pos[0]) - bar_width // 2
-        bar_y = int(self.pos[1]) - offset_y
-
-        # Background bar (grey)
-        pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height))
+    def draw_health_bar(self, screen: 'pygame.Surface') -> 'pygame.Rect':
+        """Draw a simple health bar above the enemy."""
+        bar_x = int(self.pos[0]) - HEALTH_BAR_WIDTH // 2
+        bar_y = int(self.pos[1]) - HEALTH_BAR_OFFSET
+        return screen.blit(health_bar(self.health, self.max_health), (bar_x, bar_y))
 
-        # Filled portion (green)
-        filled_width = int(bar_width * health_ratio)
-        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, filled_width, bar_height))
-
-    def draw(self, screen):
-        pygame.draw.circle(
-            screen, self.color, (int(self.pos[0]), int(self.pos[1])), self.size
+    def sprites(self) -> list:
+        # Pre-rendered body and health bar, for batching with Surface.blits
+        return enemy_sprites(
+            int(self.pos[0]), int(self.pos[1]), self.size, self.color, self.health, self.max_health
         )
-        self.draw_health_bar(screen)
+
+    def draw(self, screen) -> 'pygame.Rect':
+        return draw_sprites(screen, self.sprites())[0]
 
 
 class LightSlowEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 1, 40, 10, BLUE, 10, 10)
 
 
 class LightFastEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 5, 70, 10, BLUE, 15, 15)
 
 
 class MediumSlowEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 1, 80, 15, YELLOW, 20, 20)
 
 
 class MediumFastEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 5, 120, 15, YELLOW, 25, 25)
 
 
 class HeavySlowEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 1, 150, 18, BROWN, 30, 30)
 
 
 class HeavyFastEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 3, 200, 18, BROWN, 35, 35)
 
 
 class Boss(Enemy):
+    __slots__ = ()
+
     def __init__(self, path: list[tuple[int, int]]):
         super().__init__(path, 1, 10000, 20, PURPLE, 100, 100)
 
-    def draw(self, screen: pygame.Surface):
-        pygame.draw.circle(screen, self.color, (int(self.pos[0]), int(self.pos[1])), 20)
-        self.draw_health_bar(screen)
+    def sprites(self) -> list:
+        return enemy_sprites(
+            int(self.pos[0]), int(self.pos[1]), 20, self.color, self.health, self.max_health
+        )
 
 
 class DynamicEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, path, speed, health, size, color, gold_value, score_value=None):
         super().__init__(path, speed, health, size, color, gold_value, score_value)
@@ -0,0 +1,397 @@
+import numpy as np
+
+from config import FPS
+from enemies.enemy import Enemy
+from enemies.sprites import draw_sprites, enemy_sprites
+from game.path import ArcPath, compile_path
+
+
+class EnemyView:
+    """Attribute-compatible stand-in for an Enemy that lives in an EnemyStore row.
+
+    Turret code reads ``pos`` and writes ``health``/``speed`` exactly as it does on
+    Enemy objects; the reads and writes go straight to the store's columns. Views
+    are only made for enemies something asks about (a target, a kill event) and
+    find their row through the store's uid -> row table, re-read after each
+    compaction. When the row is compacted away the view is detached onto a
+    one-row snapshot, so projectiles and turrets still holding it see the
+    enemy's final state.
+    """
+
+    __slots__ = ('_store', '_row', '_epoch', 'uid', 'handle')
+
+    def __init__(self, store: 'EnemyStore', row: int, uid: int):
+        self._store = store
+        self._row = row
+        self._epoch = store.epoch  # The store's compaction count when _row was read
+        self.uid = uid
+        self.handle: int | None = None  # Set by EntityRegistry.register
+
+    @property
+    def row(self) -> int:
+        store = self._store
+        if self._epoch != store.epoch:
+            self._row = int(store.rows[self.uid])
+            self._epoch = store.epoch
+        return self._row
+
+    # pos, distance, health and reached_end are read by every turret every
+    # tick, so they check the epoch inline rather than through ``row``
+    @property
+    def pos(self) -> tuple[float, float]:
+        store = self._store
+        return store.position_tuples()[self._row if self._epoch == store.epoch else self.row]
+
+    @property
+    def distance(self) -> float:
+        store = self._store
+        return store.distance.item(self._row if self._epoch == store.epoch else self.row)
+
+    @property
+    def health(self) -> float:
+        store = self._store
+        return store.health.item(self._row if self._epoch == store.epoch else self.row)
+
+    @health.setter
+    def health(self, value: float):
+        self._store.health[self.row] = value
+
+    @property
+    def speed(self) -> float:
+        return self._store.speed.item(self.row)
+
+    @speed.setter
+    def speed(self, value: float):
+        self._store.speed[self.row] = value
+
+    @property
+    def base_speed(self) -> float:
+        return self._store.base_speed.item(self.row)
+
+    @property
+    def max_health(self) -> float:
+        return self._store.max_health.item(self.row)
+
+    @property
+    def path_index(self) -> int:
+        return self._store.path.segment_index(self.distance)
+
+    @property
+    def path(self) -> ArcPath:
+        return self._store.path
+
+    @property
+    def reached_end(self) -> bool:
+        store = self._store
+        return store.reached_end.item(self._row if self._epoch == store.epoch else self.row)
+
+    @property
+    def gold_value(self) -> int:
+        return self._store.gold_value.item(self.row)
+
+    @property
+    def score_value(self) -> int:
+        return self._store.score_value.item(self.row)
+
+    @property
+    def damage(self) -> int:
+        return self._store.damage.item(self.row)
+
+    @property
+    def size(self) -> int:
+        return self._store.size.item(self.row)
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return tuple(self._store.color[self.row].tolist())
+
+    def sprites(self) -> list:
+        return self._store.row_sprites(self.row)
+
+    def draw(self, screen: 'pygame.Surface') -> 'pygame.Rect':
+        return self._store.draw_row(screen, self.row)
+
+
+# Below this many rows a Python scan of the positions beats numpy's per-call overhead
+NUMPY_SCAN_ROWS = 32
+
+# Column and direction each targeting strategy ranks rows by, as in turret.TARGETING
+TARGETING_COLUMNS = {
+    'first': ('distance', True),
+    'last': ('distance', False),
+    'strongest': ('health', True),
+    'weakest': ('health', False),
+}
+
+
+class EnemyStore:
+    """Struct-of-arrays container for a wave's enemies.
+
+    Every column holds one value per live enemy in rows ``0..len(self)-1``.
+    Movement is a single vectorized step over all rows and removal of dead or
+    finished enemies is a bulk compaction, instead of per-object Python loops.
+    Enemies store only their distance along the path; x/y are interpolated for
+    all rows at once the first time they are needed after a change.
+
+    The store is also what turrets are handed each tick: ``in_range`` and
+    ``select`` answer from the columns and only make views for the enemies
+    they return.
+    """
+
+    def __init__(self, path: list[tuple[int, int]], capacity: int = 64):
+        self.count = 0
+        self._next_uid = 0
+        self._views: dict[int, EnemyView] = {}
+        self.rows = np.full(capacity, -1, dtype=np.int64)  # uid -> row, -1 once removed
+        self.epoch = 0  # Bumped by every compaction that moves rows
+        self._positions: np.ndarray | None = None
+        self._position_tuples: list[tuple[float, float]] | None = None
+        self._allocate(capacity)
+        self.path: ArcPath | None = None
+        self.set_path(path)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.uid = np.zeros(capacity, dtype=np.int64)
+        self.distance = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.base_speed = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.float64)
+        self.max_health = np.zeros(capacity, dtype=np.float64)
+        self.gold_value = np.zeros(capacity, dtype=np.int32)
+        self.score_value = np.zeros(capacity, dtype=np.int32)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.reached_end = np.zeros(capacity, dtype=bool)
+
+    def _columns(self) -> tuple[str, ...]:
+        return (
+            'uid', 'distance', 'speed', 'base_speed', 'health', 'max_health',
+            'gold_value', 'score_value', 'damage', 'size', 'color', 'reached_end',
+        )
+
+    def _grow(self):
+        old = {name: getattr(self, name) for name in self._columns()}
+        self._allocate(self.capacity * 2)
+        for name, column in old.items():
+            getattr(self, name)[:self.count] = column[:self.count]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self.views())
+
+    def __getitem__(self, row: int) -> EnemyView:
+        return self.view(row)
+
+    def set_path(self, path: list[tuple[int, int]]):
+        path = compile_path(path)
+        if self.count and self.path is not None:
+            # Re-map live enemies to the nearest point on the new path
+            positions = self.positions()
+            self.distance[:self.count] = [path.project(x, y) for x, y in positions.tolist()]
+            self.reached_end[:self.count] = self.distance[:self.count] >= path.length
+        self.path = path
+        self._cumulative = np.asarray(path.cumulative)
+        self._xs = np.asarray(path.xs)
+        self._ys = np.asarray(path.ys)
+        self._positions = self._position_tuples = None
+
+    def _interpolate(self) -> tuple[np.ndarray, np.ndarray]:
+        distance = self.distance[:self.count]
+        return (
+            np.interp(distance, self._cumulative, self._xs),
+            np.interp(distance, self._cumulative, self._ys),
+        )
+
+    def positions(self) -> np.ndarray:
+        # (n, 2) array of x/y for every live row, interpolated from distance
+        if self._positions is None:
+            self._positions = np.column_stack(self._interpolate())
+        return self._positions
+
+    def position_tuples(self) -> list[tuple[float, float]]:
+        # x/y per row as tuples, for views and small range scans read one at a time
+        tuples = self._position_tuples
+        if tuples is None:
+            xs, ys = self._interpolate()
+            tuples = self._position_tuples = list(zip(xs.tolist(), ys.tolist()))
+        return tuples
+
+    def _new_uids(self, count: int) -> np.ndarray:
+        while self.count + count > self.capacity:
+            self._grow()
+        uids = np.arange(self._next_uid, self._next_uid + count)
+        self._next_uid += count
+        if self._next_uid > len(self.rows):
+            rows = np.full(max(2 * len(self.rows), self._next_uid), -1, dtype=np.int64)
+            rows[:len(self.rows)] = self.rows
+            self.rows = rows
+        self.rows[uids] = np.arange(self.count, self.count + count)
+        return uids
+
+    def add(self, enemy: Enemy) -> EnemyView:
+        # Copy a freshly built Enemy into the next free row
+        uid = int(self._new_uids(1)[0])
+        row = self.count
+        self.uid[row] = uid
+        self.distance[row] = enemy.distance
+        self.speed[row] = enemy.speed
+        self.base_speed[row] = enemy.base_speed
+        self.health[row] = enemy.health
+        self.max_health[row] = enemy.max_health
+        self.gold_value[row] = enemy.gold_value
+        self.score_value[row] = enemy.score_value
+        self.damage[row] = enemy.damage
+        self.size[row] = enemy.size
+        self.color[row] = enemy.color
+        self.reached_end[row] = enemy.reached_end
+        self.count += 1
+        self._positions = self._position_tuples = None
+        return self.view(row)
+
+    def spawn(self, timeline: 'SpawnTimeline', due: slice) -> np.ndarray:
+        """Fill new rows straight from a wave's timeline columns; returns their uids."""
+        count = len(timeline.times[due])
+        uids = self._new_uids(count)
+        rows = slice(self.count, self.count + count)
+        self.uid[rows] = uids
+        self.distance[rows] = 0.0
+        self.speed[rows] = timeline.speed[due]
+        self.base_speed[rows] = timeline.speed[due]
+        self.health[rows] = timeline.health[due]
+        self.max_health[rows] = timeline.health[due]
+        self.gold_value[rows] = timeline.gold[due]
+        self.score_value[rows] = timeline.gold[due]
+        self.damage[rows] = 10  # Same as Enemy.damage
+        self.size[rows] = timeline.size[due]
+        self.color[rows] = timeline.color[due]
+        self.reached_end[rows] = False
+        self.count += count
+        self._positions = self._position_tuples = None
+        return uids
+
+    def view(self, row: int) -> EnemyView:
+        """The one view of the enemy in ``row``, made on first use."""
+        uid = int(self.uid[row])
+        view = self._views.get(uid)
+        if view is None:
+            view = self._views[uid] = EnemyView(self, row, uid)
+        return view
+
+    def views(self) -> tuple[EnemyView, ...]:
+        # A view for every row; the per-tick path never needs them all
+        return tuple(self.view(row) for row in range(self.count))
+
+    def in_range_rows(self, turret) -> list[int]:
+        # Same circle test as Turret.enemies_in_range, rows in ascending order
+        x, y = turret.pos
+        reach = turret.range ** 2
+        if self.count < NUMPY_SCAN_ROWS:
+            return [
+                row for row, (ex, ey) in enumerate(self.position_tuples())
+                if (ex - x) ** 2 + (ey - y) ** 2 <= reach
+            ]
+        positions = self.positions()
+        dx = positions[:, 0] - x
+        dy = positions[:, 1] - y
+        return np.flatnonzero(dx * dx + dy * dy <= reach).tolist()
+
+    def in_range(self, turret) -> list[EnemyView]:
+        return [self.view(row) for row in self.in_range_rows(turret)]
+
+    def select(self, turret, strategy: str = 'first', skip=None) -> EnemyView | None:
+        """The in-range enemy ``strategy`` prefers, ties going to the lowest row.
+
+        Enemies for which ``skip`` returns True (e.g. already doomed) are passed over.
+        """
+        rows = self.in_range_rows(turret)
+        if not rows:
+            return None
+        column, highest = TARGETING_COLUMNS[strategy]
+        values = getattr(self, column)[rows]
+        if highest:
+            values = -values
+        ranked = list(zip(values.tolist(), rows))
+        best = self.view(min(ranked)[1])
+        if skip is None or not skip(best):
+            return best
+        # Rank the rest only when the best one is skipped
+        for _, row in sorted(ranked):
+            view = self.view(row)
+            if not skip(view):
+                return view
+        return None
+
+    def move(self, dt: float = 1 / FPS):
+        # Same rules as Enemy.move, applied to every row at once
+        n = self.count
+        if n == 0:
+            return
+        distance = self.distance[:n]
+        distance += self.speed[:n] * (dt * FPS)
+        finished = distance >= self.path.length
+        distance[finished] = self.path.length
+        self.reached_end[:n] |= finished
+        self._positions = self._position_tuples = None
+
+    def compact(self, keep: np.ndarray):
+        """Drop every row whose ``keep`` flag is False, preserving row order."""
+        n = self.count
+        if keep.all():
+            return
+        removed = np.flatnonzero(~keep)
+        for row in removed.tolist():
+            view = self._views.pop(int(self.uid[row]), None)
+            if view is not None:
+                snapshot = view._store = self._snapshot(row)
+                view._row = 0
+                view._epoch = snapshot.epoch
+        self.rows[self.uid[removed]] = -1
+        kept = np.flatnonzero(keep)
+        for name in self._columns():
+            column = getattr(self, name)
+            column[:len(kept)] = column[kept]
+        self.count = len(kept)
+        self._positions = self._position_tuples = None
+        # Surviving views re-read their row from the table on next use
+        self.rows[self.uid[:self.count]] = np.arange(self.count)
+        self.epoch += 1
+
+    def _snapshot(self, row: int) -> 'EnemyStore':
+        snapshot = EnemyStore(self.path, capacity=1)
+        for name in self._columns():
+            getattr(snapshot, name)[0] = getattr(self, name)[row]
+        snapshot.count = 1
+        return snapshot
+
+    def row_sprites(self, row: int) -> list:
+        x, y = (int(v) for v in self.positions()[row])
+        return enemy_sprites(
+            x, y, int(self.size[row]), self.color[row].tolist(),
+            self.health[row], self.max_health[row],
+        )
+
+    def draw_row(self, screen: 'pygame.Surface', row: int) -> 'pygame.Rect':
+        return draw_sprites(screen, self.row_sprites(row))[0]
+
+    def sprites(self) -> list:
+        # Body and health bar for every row, read column-wise
+        n = self.count
+        return [
+            sprite
+            for (x, y), size, color, health, max_health in zip(
+                self.positions().astype(np.int64).tolist(),
+                self.size[:n].tolist(),
+                self.color[:n].tolist(),
+                self.health[:n].tolist(),
+                self.max_health[:n].tolist(),
+            )
+            for sprite in enemy_sprites(x, y, size, color, health, max_health)
+        ]
+
+    def draw(self, screen: 'pygame.Surface') -> list['pygame.Rect']:
+        # One batched blit for the whole store; one rect per enemy, for dirty-rect rendering
+        return draw_sprites(screen, self.sprites())
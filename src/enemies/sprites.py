@@ -0,0 +1,67 @@
+from functools import lru_cache
+
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+from config import RED
+
+HEALTH_BAR_WIDTH = 50
+HEALTH_BAR_HEIGHT = 5
+HEALTH_BAR_OFFSET = 25  # How far above the enemy's centre the bar starts
+COLORKEY = (255, 0, 255)
+
+
+def _prepare(surface: 'pygame.Surface') -> 'pygame.Surface':
+    # Match the display's pixel format once there is one, so blits need no conversion
+    return surface.convert() if pygame.display.get_surface() is not None else surface
+
+
+@lru_cache(maxsize=None)
+def body_sprite(radius: int, color: tuple[int, int, int]) -> tuple['pygame.Surface', int]:
+    """Pre-rasterized enemy body and its offset from the enemy's centre.
+
+    Drawn with the same ``pygame.draw.circle`` call as before and cropped
+    to the pixels it touched, so blitting it is pixel-identical. The corners
+    are a colorkey rather than per-pixel alpha, which blits several times
+    faster.
+    """
+    key = COLORKEY if color != COLORKEY else (0, 0, 0)
+    canvas = pygame.Surface((2 * radius + 2, 2 * radius + 2))
+    canvas.fill(key)
+    touched = pygame.draw.circle(canvas, color, (radius + 1, radius + 1), radius)
+    sprite = _prepare(canvas.subsurface(touched).copy())
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    return sprite, touched.x - (radius + 1)
+
+
+@lru_cache(maxsize=None)
+def health_bar_strip(filled: int) -> 'pygame.Surface':
+    # Health is quantized to whole filled pixels, so there are only 51 strips
+    strip = pygame.Surface((HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT))
+    strip.fill(RED)
+    strip.fill((0, 255, 0), (0, 0, filled, HEALTH_BAR_HEIGHT))
+    return _prepare(strip)
+
+
+def health_bar(health: float, max_health: float) -> 'pygame.Surface':
+    filled = int(HEALTH_BAR_WIDTH * (health / max_health))
+    return health_bar_strip(min(max(filled, 0), HEALTH_BAR_WIDTH))
+
+
+def enemy_sprites(
+    x: int, y: int, radius: int, color: tuple, health: float, max_health: float
+) -> list[tuple['pygame.Surface', tuple[int, int]]]:
+    """Body and health bar of one enemy centred on (x, y), ready for ``Surface.blits``."""
+    body, offset = body_sprite(radius, tuple(color))
+    return [
+        (body, (x + offset, y + offset)),
+        (health_bar(health, max_health), (x - HEALTH_BAR_WIDTH // 2, y - HEALTH_BAR_OFFSET)),
+    ]
+
+
+def draw_sprites(screen: 'pygame.Surface', sprites: list) -> list['pygame.Rect']:
+    """Blit body/health-bar pairs in one batched call; one rect per enemy."""
+    rects = screen.blits(sprites)
+    return [body.union(bar) for body, bar in zip(rects[::2], rects[1::2])]
@@ -0,0 +1,101 @@
+from typing import Type
+
+from turrets import BulletTurret, IceTurret, TeslaTurret
+from turrets.turret import Turret
+
+TURRET_TYPES: dict[str, Type[Turret]] = {
+    'bullet': BulletTurret,
+    'tesla': TeslaTurret,
+    'ice': IceTurret,
+}
+UPGRADE = 'upgrade'
+
+
+def parse_build_order(spec: str) -> list[str]:
+    """``"bullet*2,tesla@12:5,upgrade"`` -> ``['bullet', 'bullet', 'tesla@12:5', 'upgrade']``.
+
+    ``@col:row`` pins a turret to a grid cell instead of the best free one.
+    """
+    actions = []
+    for token in spec.split(','):
+        action, _, repeat = token.strip().partition('*')
+        name = action.partition('@')[0]
+        if name not in TURRET_TYPES and name != UPGRADE:
+            raise ValueError(f"Unknown build action: {name!r}")
+        actions.extend([action] * (int(repeat) if repeat else 1))
+    return actions
+
+
+def placement(name: str, col: int, row: int) -> str:
+    return f"{name}@{col}:{row}"
+
+
+def cell_centres(game_map) -> list[tuple[int, int]]:
+    size = game_map.grid_size
+    return [
+        (x * size + size // 2, y * size + size // 2)
+        for y, row in enumerate(game_map.grid)
+        for x, free in enumerate(row)
+        if free
+    ]
+
+
+def best_cell(game_map, turret_range: float) -> tuple[int, int] | None:
+    # Free cell whose range covers the most road; ties go to the first cell in grid order
+    best, best_cover = None, 0.0
+    for x, y in cell_centres(game_map):
+        cover = sum(end - start for start, end in game_map.path.coverage(x, y, turret_range))
+        if cover > best_cover:
+            best, best_cover = (x, y), cover
+    return best
+
+
+class BuildOrder:
+    """Plays a fixed list of build actions, each one as soon as it is affordable.
+
+    Turrets go on the free cell that covers the most road for their range;
+    ``upgrade`` upgrades the lowest-level turret, oldest first. Actions that
+    can never be done are passed over and recorded in ``skipped``.
+    Everything depends only on the simulation state, so a seed always plays
+    out the same.
+    """
+
+    def __init__(self, actions: list[str]):
+        self.actions = actions
+        self.next = 0
+        # Actions that could never be done (cell taken, nothing left to upgrade)
+        # and were passed over, so results can say the build differed
+        self.skipped: list[str] = []
+        # One unplaced turret per type, to read its cost and range
+        self._probes = {name: turret_type(0, 0) for name, turret_type in TURRET_TYPES.items()}
+
+    def apply(self, simulation: 'Simulation'):
+        while self.next < len(self.actions):
+            if not self._try(simulation, self.actions[self.next]):
+                return
+            self.next += 1
+
+    def _try(self, simulation: 'Simulation', action: str) -> bool:
+        # True once the action is done (or can never be done) and the next one may run
+        if action == UPGRADE:
+            upgradable = [turret for turret in simulation.turrets if turret.upgrade_level < 2]
+            if not upgradable:
+                self.skipped.append(action)
+                return True
+            turret = min(upgradable, key=lambda turret: turret.upgrade_level)
+            return simulation.upgrade_turret(turret)
+        name, _, pinned = action.partition('@')
+        probe = self._probes[name]
+        if not simulation.stats.can_afford(probe.cost):
+            return False
+        if pinned:
+            size = simulation.game_map.grid_size
+            col, row = (int(part) for part in pinned.split(':'))
+            cell = (col * size + size // 2, row * size + size // 2)
+        else:
+            cell = best_cell(simulation.game_map, probe.range)
+        # A taken cell never frees up on its own, so the action is skipped
+        # rather than retried forever
+        if cell is None or simulation.place_turret(TURRET_TYPES[name], *cell) is None:
+            self.skipped.append(action)
+        return True
@@ -0,0 +1,47 @@
+from bisect import bisect_left, bisect_right
+
+from game.path import ArcPath
+
+
+class CoverageIndex:
+    """Enemies sorted by distance travelled, queried by turret coverage intervals.
+
+    Each turret caches the arc-length intervals of the road inside its range
+    (``Turret.coverage``), so "which enemies can I hit" becomes a pair of
+    bisections per interval over the sorted distances instead of a 2-D
+    distance test per turret/enemy pair. Results come back in enemy-list order.
+    """
+
+    def __init__(self):
+        self.enemies = ()
+        self.path: ArcPath | None = None
+        self.distances: list[float] = []
+        self.entries: list[tuple[int, object]] = []
+
+    def rebuild(self, enemies, path: ArcPath):
+        # Spawn order is close to reverse progress order, which timsort handles in linear time
+        entries = sorted(
+            ((enemy.distance, order, enemy) for order, enemy in enumerate(enemies)),
+            key=lambda entry: entry[:2],
+        )
+        self.enemies = enemies
+        self.path = path
+        self.distances = [distance for distance, _, _ in entries]
+        self.entries = [(order, enemy) for _, order, enemy in entries]
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def __len__(self) -> int:
+        return len(self.enemies)
+
+    def in_range(self, turret) -> list:
+        if turret.path is not self.path:
+            turret.set_path(self.path)
+        found = []
+        for start, end in turret.coverage:
+            lo = bisect_left(self.distances, start)
+            hi = bisect_right(self.distances, end)
+            found.extend(self.entries[lo:hi])
+        found.sort(key=lambda entry: entry[0])
+        return [enemy for _, enemy in found]
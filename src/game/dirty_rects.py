@@ -0,0 +1,55 @@
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+
+def merge_rects(rects: list['pygame.Rect']) -> list['pygame.Rect']:
+    """Merge rects whose union covers no more than the two of them apart.
+
+    Two rects are merged when the union's area is at most the sum of their
+    areas, i.e. when they overlap at least as much as the union would add.
+    Touching enemies in a dense wave collapse into a few strips while
+    far-apart ones stay separate, so the update list stays short without
+    pushing large untouched regions. Empty rects are dropped.
+    """
+    merged: list[pygame.Rect] = []
+    for rect in sorted((rect for rect in rects if rect.w > 0 and rect.h > 0), key=lambda r: r.x):
+        while True:
+            for i, other in enumerate(merged):
+                union = other.union(rect)
+                if union.w * union.h <= other.w * other.h + rect.w * rect.h:
+                    # The grown rect may now swallow rects it missed before
+                    rect = union
+                    del merged[i]
+                    break
+            else:
+                break
+        merged.append(rect)
+    return merged
+
+
+class DirtyRects:
+    """Redraws and pushes only the screen regions that changed since last frame.
+
+    Everything is still drawn every frame, but draws report the rect they
+    touched. Before drawing, the background is restored under last frame's
+    rects; afterwards those and this frame's rects are pushed with
+    ``pygame.display.update``. ``previous`` is None when the whole screen is
+    stale (first frame, or after a menu drew over it), and the next frame
+    falls back to a full redraw and flip.
+    """
+
+    def __init__(self):
+        self.previous: list[pygame.Rect] | None = None
+
+    def invalidate(self):
+        self.previous = None
+
+    def present(self, rects: list['pygame.Rect']):
+        current = merge_rects(rects)
+        if self.previous is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(merge_rects(self.previous + current))
+        self.previous = current
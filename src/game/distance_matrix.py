@@ -0,0 +1,54 @@
+import numpy as np
+
+from config import DISTANCE_MATRIX_BUDGET
+
+
+class DistanceMatrix:
+    """All-turrets-vs-all-enemies range test done in one NumPy pass per tick.
+
+    ``rebuild`` computes the squared distance from every turret to every enemy,
+    thresholds it against each turret's squared range and keeps one row of
+    enemy indices per turret. If the full matrix would exceed ``memory_budget``
+    bytes, turrets are processed in chunks that fit. Turrets then read their
+    own row through ``in_range``.
+    """
+
+    def __init__(self, memory_budget: int = DISTANCE_MATRIX_BUDGET):
+        self.memory_budget = memory_budget
+        self.enemies = ()
+        self.rows: dict[object, np.ndarray] = {}
+
+    def rebuild(self, enemies, turrets, positions: np.ndarray = None):
+        self.enemies = enemies
+        self.rows = {}
+        if not turrets:
+            return
+        if positions is None:
+            positions = np.array([enemy.pos for enemy in enemies], dtype=np.float64).reshape(-1, 2)
+        enemy_x, enemy_y = positions[:, 0], positions[:, 1]
+        turret_pos = np.array([turret.pos for turret in turrets], dtype=np.float64)
+        ranges2 = np.array([turret.range for turret in turrets], dtype=np.float64) ** 2
+        # dx, dy and the squared distance are each one float64 per pair
+        bytes_per_turret = max(len(enemies), 1) * 8 * 3
+        chunk = max(1, self.memory_budget // bytes_per_turret)
+        for start in range(0, len(turrets), chunk):
+            stop = start + chunk
+            dx = turret_pos[start:stop, 0, None] - enemy_x[None, :]
+            dy = turret_pos[start:stop, 1, None] - enemy_y[None, :]
+            within = dx * dx + dy * dy <= ranges2[start:stop, None]
+            for turret, row in zip(turrets[start:stop], within):
+                self.rows[turret] = np.flatnonzero(row)
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def __len__(self) -> int:
+        return len(self.enemies)
+
+    def in_range(self, turret) -> list:
+        row = self.rows.get(turret)
+        if row is None:
+            # Turret placed after this tick's rebuild
+            return turret.enemies_in_range(self.enemies)
+        enemies = self.enemies
+        return [enemies[i] for i in row.tolist()]
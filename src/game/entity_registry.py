@@ -0,0 +1,89 @@
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityRegistry:
+    """Hands out generation-checked integer handles for live entities.
+
+    A handle packs a slot index and the slot's generation. Releasing an
+    entity bumps its slot's generation, so old handles to it stop resolving
+    and a recycled slot can never be mistaken for the entity that used it
+    before. ``get`` and ``is_alive`` are O(1), and because handles are plain
+    ints, turrets can keep their targets in sets and snapshots can store them.
+
+    There is no global registry: a Simulation owns one for everything in it,
+    and a turret or projectile system used on its own owns a private one.
+    """
+
+    def __init__(self):
+        self._entities: list = []
+        self._generations: list[int] = []
+        self._free: list[int] = []
+        # id(entity) -> handle, for entities whose ``handle`` another registry overwrote
+        self._handles: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities) - len(self._free)
+
+    def register(self, entity) -> int:
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._entities)
+            self._entities.append(None)
+            self._generations.append(0)
+        self._entities[index] = entity
+        handle = (self._generations[index] << INDEX_BITS) | index
+        entity.handle = handle
+        self._handles[id(entity)] = handle
+        return handle
+
+    def handle_of(self, entity) -> int:
+        # Entities spawned outside a simulation are registered on first use. A
+        # handle from another registry is not trusted: it may name something
+        # else here. Standalone turrets sharing enemies each keep theirs
+        handle = entity.handle
+        if handle is not None and self.get(handle) is entity:
+            return handle
+        handle = self._handles.get(id(entity))
+        if handle is not None and self.get(handle) is entity:
+            return handle
+        return self.register(entity)
+
+    def release(self, handle: int):
+        index = handle & INDEX_MASK
+        if not self.is_alive(handle):
+            return
+        del self._handles[id(self._entities[index])]
+        self._entities[index] = None
+        self._generations[index] += 1
+        self._free.append(index)
+
+    def get(self, handle: int):
+        """The live entity behind ``handle``, or None once it was released."""
+        index = handle & INDEX_MASK
+        if index < len(self._entities) and self._generations[index] == handle >> INDEX_BITS:
+            return self._entities[index]
+        return None
+
+    def is_alive(self, handle: int) -> bool:
+        return self.get(handle) is not None
+
+    def get_target(self, handle: int):
+        """The enemy behind ``handle`` while it still counts as a target.
+
+        One found killed or leaked is released on the spot, so owners without
+        a wave event stream (standalone turrets) don't hold dead enemies.
+        """
+        target = self.get(handle)
+        if target is not None and (target.health <= 0 or target.reached_end):
+            self.release(handle)
+            return None
+        return target
+
+    def release_removed(self, events: list):
+        # Subscribed to the wave event stream: killed and leaked enemies stop resolving
+        for event in events:
+            handle = self._handles.get(id(event.enemy))
+            if handle is not None:
+                self.release(handle)
@@ -0,0 +1,204 @@
+import random
+
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+from config import WIDTH, HEIGHT, MENU_HEIGHT, GREEN, BLUE, BROWN, GRAY, LIGHT_GRAY
+from game.path import ArcPath
+
+
+class GameMap:
+    def __init__(self, rng: random.Random = None):
+        self.grid_size = 30  # Size of each grid cell
+        self.bg_color = GREEN
+        self.path_color = BLUE
+        self.road_color = BROWN
+        self.reserved_rows = 2  # Top two rows reserved
+        # Own RNG so that map generation never touches the process-wide one
+        self.rng = rng if rng is not None else random.Random()
+        self.path = ArcPath(self.generate_random_path())
+        self.grid = self.create_grid()
+        # Pre-rendered map, created on first draw and patched cell by cell after that
+        self.background = None
+        self._base = None  # Background without the grid outlines, to restore cells from
+        self._cell_outline = None
+        self.patched: list = []  # Cells patched since the last draw, still stale on screen
+
+    def generate_random_path(self):
+        # Path starts at left edge, ends at right edge, only 90-degree turns
+        cols = WIDTH // self.grid_size
+        rows = (HEIGHT - MENU_HEIGHT) // self.grid_size
+        # Start y is at least self.reserved_rows, avoid top two rows
+        x, y = 1, self.rng.randint(self.reserved_rows + 1, rows-3)
+        path = [(x * self.grid_size + self.grid_size // 2, y * self.grid_size + self.grid_size // 2)]
+        direction = 'right'
+        visited = set()
+        visited.add((x, y))
+        must_continue = False
+        while x < cols - 2:
+            moves = []
+            if must_continue:
+                if direction == 'right' and x < cols - 2:
+                    moves = ['right']
+                elif direction == 'up' and y > self.reserved_rows:
+                    moves = ['up']
+                elif direction == 'down' and y < rows - 2:
+                    moves = ['down']
+            else:
+                if direction != 'left' and x < cols - 2:
+                    moves.append('right')
+                if direction != 'down' and y > self.reserved_rows:
+                    moves.append('up')
+                if direction != 'up' and y < rows - 2:
+                    moves.append('down')
+                self.rng.shuffle(moves)
+            moved = False
+            for move in moves:
+                nx, ny = x, y
+                if move == 'right':
+                    nx += 1
+                elif move == 'up':
+                    ny -= 1
+                elif move == 'down':
+                    ny += 1
+                if (nx, ny) not in visited and 1 <= nx < cols-1 and self.reserved_rows <= ny < rows-1:
+                    x, y = nx, ny
+                    path.append((x * self.grid_size + self.grid_size // 2, y * self.grid_size + self.grid_size // 2))
+                    visited.add((x, y))
+                    if move != direction:
+                        must_continue = True
+                    else:
+                        must_continue = False
+                    direction = move
+                    moved = True
+                    break
+            if not moved:
+                if x < cols - 2:
+                    x += 1
+                    path.append((x * self.grid_size + self.grid_size // 2, y * self.grid_size + self.grid_size // 2))
+                    visited.add((x, y))
+                    must_continue = False
+                    direction = 'right'
+                else:
+                    break
+        # End at right edge
+        path.append((WIDTH - self.grid_size // 2, y * self.grid_size + self.grid_size // 2))
+        return path
+
+    def create_grid(self):
+        rows = (HEIGHT - MENU_HEIGHT) // self.grid_size
+        cols = WIDTH // self.grid_size
+        grid = [[True for _ in range(cols)] for _ in range(rows)]
+        # Mark reserved rows as unavailable
+        for y in range(self.reserved_rows):
+            for x in range(cols):
+                grid[y][x] = False
+        # Mark cells containing the road as unavailable
+        for i in range(len(self.path) - 1):
+            start = self.path[i]
+            end = self.path[i + 1]
+            self.mark_path_cells(grid, start, end)
+        return grid
+
+    def mark_path_cells(self, grid, start, end):
+        # Convert coordinates to grid positions
+        start_x, start_y = start[0] // self.grid_size, start[1] // self.grid_size
+        end_x, end_y = end[0] // self.grid_size, end[1] // self.grid_size
+
+        # Mark cells along the path
+        if start_x == end_x:  # Vertical line
+            for y in range(min(start_y, end_y), max(start_y, end_y) + 1):
+                if y < len(grid):
+                    grid[y][start_x] = False
+        else:  # Horizontal line
+            for x in range(min(start_x, end_x), max(start_x, end_x) + 1):
+                if start_y < len(grid) and x < len(grid[0]):
+                    grid[start_y][x] = False
+
+    def is_valid_placement(self, x: int, y: int) -> bool:
+        grid_x = x // self.grid_size
+        grid_y = y // self.grid_size
+        # Check if within grid bounds and not in reserved rows
+        if (grid_y >= len(self.grid) or grid_x >= len(self.grid[0]) or
+            grid_y < self.reserved_rows or grid_x < 0):
+            return False
+        return self.grid[grid_y][grid_x]
+
+    def snap_to_cell(self, x: int, y: int) -> tuple[int, int]:
+        # Centre of the grid cell containing (x, y)
+        grid_x = (x // self.grid_size) * self.grid_size + self.grid_size // 2
+        grid_y = (y // self.grid_size) * self.grid_size + self.grid_size // 2
+        return grid_x, grid_y
+
+    def occupy_cell(self, x: int, y: int):
+        grid_x = x // self.grid_size
+        grid_y = y // self.grid_size
+        if grid_y < len(self.grid) and grid_x < len(self.grid[0]):
+            self.grid[grid_y][grid_x] = False
+            self._patch_cell(grid_x, grid_y)
+
+    def free_cell(self, x: int, y: int):
+        grid_x = x // self.grid_size
+        grid_y = y // self.grid_size
+        if grid_y < len(self.grid) and grid_x < len(self.grid[0]):
+            self.grid[grid_y][grid_x] = True
+            self._patch_cell(grid_x, grid_y)
+
+    def invalidate(self):
+        # Path or grid replaced wholesale: re-render everything on the next draw
+        self.background = None
+
+    def draw(self, screen: 'pygame.Surface', rects: list['pygame.Rect'] = None) -> list['pygame.Rect']:
+        # With rects, only restore the background under them and under cells
+        # patched since the last draw (dirty-rect rendering); returns those cells
+        if self.background is None:
+            self._render(screen)
+            rects = None
+        patched, self.patched = self.patched, []
+        if rects is None:
+            screen.blit(self.background, (0, 0))
+            return []
+        for rect in rects + patched:
+            screen.blit(self.background, rect, rect)
+        return patched
+
+    def _render(self, screen: 'pygame.Surface'):
+        self._base = pygame.Surface(screen.get_size()).convert(screen)
+        self._base.fill(self.bg_color)
+        # Draw reserved top rows as gray
+        for y in range(self.reserved_rows):
+            rect = pygame.Rect(0, y * self.grid_size, WIDTH, self.grid_size)
+            pygame.draw.rect(self._base, GRAY, rect)
+        # Draw the path
+        for i in range(len(self.path) - 1):
+            pygame.draw.line(
+                self._base, self.road_color, self.path[i], self.path[i + 1], 10
+            )
+        for point in self.path:
+            pygame.draw.circle(self._base, self.path_color, point, 5)
+        # Transparent outline of one free cell
+        self._cell_outline = pygame.Surface((self.grid_size, self.grid_size), pygame.SRCALPHA)
+        pygame.draw.rect(
+            self._cell_outline, (*LIGHT_GRAY, 128), self._cell_outline.get_rect(), 1
+        )
+        self.background = self._base.copy()
+        for y in range(self.reserved_rows, len(self.grid)):
+            for x in range(len(self.grid[0])):
+                if self.grid[y][x]:
+                    self.background.blit(
+                        self._cell_outline, (x * self.grid_size, y * self.grid_size)
+                    )
+
+    def _patch_cell(self, grid_x: int, grid_y: int):
+        # Redraw one cell after it was occupied or freed; outlines never leave their cell
+        if self.background is None or grid_y < self.reserved_rows:
+            return
+        rect = pygame.Rect(
+            grid_x * self.grid_size, grid_y * self.grid_size, self.grid_size, self.grid_size
+        )
+        self.background.blit(self._base, rect, rect)
+        if self.grid[grid_y][grid_x]:
+            self.background.blit(self._cell_outline, rect)
+        self.patched.append(rect)
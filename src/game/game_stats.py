@@ -0,0 +1,69 @@
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+from config import WIDTH, WHITE, RED, BLACK, STARTING_GOLD
+from text_cache import render_text
+
+
+class GameStats:
+    def __init__(self):
+        self.gold = STARTING_GOLD
+        self.max_health = 100
+        self.health = self.max_health
+        self.score = 0
+
+    def draw(self, screen: 'pygame.Surface') -> 'pygame.Rect':
+        # Draw gold
+        gold_text = render_text(f"Gold: {self.gold}", 24, (255, 215, 0))
+        rect = screen.blit(gold_text, (10, 10))
+
+        # Draw score
+        score_text = render_text(f"Score: {self.score}", 24, (0, 255, 255))
+        rect.union_ip(screen.blit(score_text, (10, 35)))
+
+        # Draw health bar
+        bar_width = 200
+        bar_height = 20
+        bar_position = (WIDTH - bar_width - 10, 10)  # Top right corner
+
+        # Draw black background first
+        rect.union_ip(pygame.draw.rect(screen, BLACK, (bar_position[0], bar_position[1], bar_width, bar_height)))
+
+        # Draw red health bar (only for remaining health)
+        health_width = int(bar_width * (self.health / self.max_health))
+        pygame.draw.rect(screen, RED, (bar_position[0], bar_position[1], health_width, bar_height))
+
+        # Draw black outline
+        pygame.draw.rect(screen, BLACK, (bar_position[0], bar_position[1], bar_width, bar_height), 2)
+
+        # Draw health text
+        health_text = render_text(f"{self.health}/{self.max_health}", 24, WHITE)
+        text_pos = (bar_position[0] + bar_width//2 - health_text.get_width()//2,
+                   bar_position[1] + bar_height//2 - health_text.get_height()//2)
+        return rect.union(screen.blit(health_text, text_pos))
+
+    def add_gold(self, amount: int):
+        self.gold += amount
+
+    def can_afford(self, cost: int) -> bool:
+        return self.gold >= cost
+
+    def spend_gold(self, cost: int):
+        self.gold -= cost
+
+    def take_damage(self, amount: int):
+        self.health = max(0, self.health - amount)
+
+    def is_game_over(self) -> bool:
+        return self.health <= 0
+
+    def add_score(self, amount: int):
+        self.score += amount
+
+    def apply_events(self, events: list):
+        # Bulk-apply a tick's kill/leak events from Wave.events
+        self.gold += sum(event.gold for event in events)
+        self.score += sum(event.score for event in events)
+        self.take_damage(sum(event.damage for event in events))
@@ -0,0 +1,95 @@
+import math
+from bisect import bisect_right
+
+
+class ArcPath(tuple):
+    """Waypoint tuple compiled into a cumulative arc-length table.
+
+    It still behaves like the plain list of waypoints (indexing, ``len``,
+    iteration), but also maps a distance travelled along the road to an x/y
+    position, so an enemy only has to store a single scalar.
+    """
+
+    def __new__(cls, waypoints):
+        return super().__new__(cls, (tuple(point) for point in waypoints))
+
+    def __init__(self, waypoints):
+        self.xs = [float(x) for x, _ in self]
+        self.ys = [float(y) for _, y in self]
+        # cumulative[i] is the distance from the start to waypoint i
+        self.cumulative = [0.0]
+        for i in range(len(self) - 1):
+            segment = math.hypot(self.xs[i + 1] - self.xs[i], self.ys[i + 1] - self.ys[i])
+            self.cumulative.append(self.cumulative[-1] + segment)
+        self.length = self.cumulative[-1]
+
+    def segment_index(self, distance: float) -> int:
+        # Index of the last waypoint passed at this distance
+        if distance >= self.length:
+            return len(self) - 1
+        return max(bisect_right(self.cumulative, distance) - 1, 0)
+
+    def position_at(self, distance: float) -> tuple[float, float]:
+        if distance <= 0:
+            return self.xs[0], self.ys[0]
+        if distance >= self.length:
+            return self.xs[-1], self.ys[-1]
+        i = bisect_right(self.cumulative, distance) - 1
+        start = self.cumulative[i]
+        t = (distance - start) / (self.cumulative[i + 1] - start)
+        return (
+            self.xs[i] + (self.xs[i + 1] - self.xs[i]) * t,
+            self.ys[i] + (self.ys[i + 1] - self.ys[i]) * t,
+        )
+
+    def project(self, x: float, y: float) -> float:
+        """Arc length of the point on the path nearest to (x, y)."""
+        best_dist2 = math.inf
+        best_distance = 0.0
+        for i in range(len(self) - 1):
+            ax, ay = self.xs[i], self.ys[i]
+            dx, dy = self.xs[i + 1] - ax, self.ys[i + 1] - ay
+            seg_len2 = dx * dx + dy * dy
+            t = 0.0
+            if seg_len2 > 0:
+                t = min(max(((x - ax) * dx + (y - ay) * dy) / seg_len2, 0.0), 1.0)
+            px, py = ax + dx * t, ay + dy * t
+            dist2 = (x - px) ** 2 + (y - py) ** 2
+            if dist2 < best_dist2:
+                best_dist2 = dist2
+                best_distance = self.cumulative[i] + (self.cumulative[i + 1] - self.cumulative[i]) * t
+        return best_distance
+
+    def coverage(self, x: float, y: float, radius: float) -> list[tuple[float, float]]:
+        """Sorted, merged arc-length intervals of the path within radius of (x, y)."""
+        intervals = []
+        radius2 = radius * radius
+        for i in range(len(self) - 1):
+            ax, ay = self.xs[i] - x, self.ys[i] - y
+            dx, dy = self.xs[i + 1] - self.xs[i], self.ys[i + 1] - self.ys[i]
+            # Solve |a + t*d|^2 <= r^2 for t in [0, 1]
+            qa = dx * dx + dy * dy
+            qb = 2 * (ax * dx + ay * dy)
+            qc = ax * ax + ay * ay - radius2
+            if qa == 0:
+                continue
+            disc = qb * qb - 4 * qa * qc
+            if disc < 0:
+                continue
+            root = math.sqrt(disc)
+            t0 = max((-qb - root) / (2 * qa), 0.0)
+            t1 = min((-qb + root) / (2 * qa), 1.0)
+            if t0 > t1:
+                continue
+            start = self.cumulative[i]
+            seg_len = self.cumulative[i + 1] - start
+            s0, s1 = start + seg_len * t0, start + seg_len * t1
+            if intervals and s0 <= intervals[-1][1]:
+                intervals[-1] = (intervals[-1][0], max(intervals[-1][1], s1))
+            else:
+                intervals.append((s0, s1))
+        return intervals
+
+
+def compile_path(path) -> ArcPath:
+    return path if isinstance(path, ArcPath) else ArcPath(path)
@@ -0,0 +1,179 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Callable
+
+import numpy as np
+
+from game.coverage_index import CoverageIndex
+from game.path import ArcPath
+
+
+def _never(enemy) -> bool:
+    return False
+
+
+class HealthTable:
+    """Sparse table over health in progress order: best enemy of any slice in O(1).
+
+    ``levels[j][i]`` is the position in the order of the best enemy among
+    ``order[i:i + 2**j]``. Best means highest ``key`` (health, or minus health
+    for the weakest), ties going to the enemy earliest in the enemy list,
+    the same pick as ``max``/``min`` over the list. Built with one
+    vectorized pass per level, so O(n log n) in numpy per tick.
+    """
+
+    def __init__(self, keys: np.ndarray, positions: np.ndarray):
+        self.keys = keys
+        self.positions = positions
+        best = np.arange(len(keys))
+        self.levels = [best]
+        width = 1
+        while 2 * width <= len(keys):
+            left, right = best[:-width], best[width:]
+            take_right = (keys[right] > keys[left]) | (
+                (keys[right] == keys[left]) & (positions[right] < positions[left])
+            )
+            best = np.where(take_right, right, left)
+            self.levels.append(best)
+            width *= 2
+
+    def rank(self, i: int) -> tuple[float, int]:
+        # Smaller is better, for heapq
+        return -self.keys[i], self.positions[i]
+
+    def best(self, lo: int, hi: int) -> int:
+        """Position in the order of the best enemy in ``order[lo:hi]``, ``hi > lo``."""
+        level = (hi - lo).bit_length() - 1
+        left = int(self.levels[level][lo])
+        right = int(self.levels[level][hi - (1 << level)])
+        return left if self.rank(left) <= self.rank(right) else right
+
+
+class ProgressIndex(CoverageIndex):
+    """Coverage index that also answers first/last/strongest/weakest queries.
+
+    The progress order is kept between ticks: removed enemies are dropped,
+    new spawns go to the front, and one insertion pass moves the few
+    enemies that overtook a neighbour, which is close to O(n) because
+    enemies rarely pass each other. A new path re-sorts from scratch.
+
+    ``first`` and ``last`` are bisections over the sorted distances.
+    ``strongest`` and ``weakest`` bisect each coverage interval too and ask
+    a ``HealthTable`` over the order for the best enemy in that slice. The
+    tables are built on the first such query of the tick, from the health
+    the enemies had then.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.order: list = []  # Enemies by (distance, list position), kept between ticks
+        self.positions: list[int] = []  # List position of each enemy in ``order``
+        self._tables: dict[str, HealthTable] = {}
+
+    def rebuild(self, enemies, path: ArcPath):
+        position = {enemy: i for i, enemy in enumerate(enemies)}
+        order = [enemy for enemy in self.order if enemy in position]
+        if len(order) < len(position):
+            known = set(order)
+            order[:0] = [enemy for enemy in enemies if enemy not in known]
+        keys = [(enemy.distance, position[enemy]) for enemy in order]
+        if path is not self.path:
+            # Every enemy was re-projected onto the new road
+            ranked = sorted(range(len(order)), key=keys.__getitem__)
+            order = [order[i] for i in ranked]
+            keys = [keys[i] for i in ranked]
+        else:
+            _insertion_pass(order, keys)
+        self.order = order
+        self.enemies = enemies
+        self.path = path
+        self.distances = [distance for distance, _ in keys]
+        self.positions = [i for _, i in keys]
+        self.entries = list(zip(self.positions, order))
+        self._tables.clear()
+
+    def select(self, turret, strategy: str = 'first', skip: Callable[[object], bool] = None):
+        """The in-range enemy ``strategy`` prefers, or None if nothing is in range.
+
+        Enemies for which ``skip`` returns True (e.g. already doomed) are passed over.
+        """
+        if turret.path is not self.path:
+            turret.set_path(self.path)
+        if skip is None:
+            skip = _never
+        if strategy == 'first':
+            return self._furthest(turret, skip)
+        if strategy == 'last':
+            return self._nearest(turret, skip)
+        if strategy in ('strongest', 'weakest'):
+            return self._best_in_range(self._table(strategy), turret, skip)
+        raise ValueError(f"Unknown targeting strategy: {strategy}")
+
+    def _furthest(self, turret, skip: Callable[[object], bool]):
+        distances = self.distances
+        for start, end in reversed(turret.coverage):
+            lo = bisect_left(distances, start)
+            hi = bisect_right(distances, end)
+            while hi > lo:
+                # Among enemies level with each other, the earliest in the list wins
+                group = max(bisect_left(distances, distances[hi - 1]), lo)
+                for _, enemy in self.entries[group:hi]:
+                    if not skip(enemy):
+                        return enemy
+                hi = group
+        return None
+
+    def _nearest(self, turret, skip: Callable[[object], bool]):
+        distances = self.distances
+        for start, end in turret.coverage:
+            for _, enemy in self.entries[bisect_left(distances, start):bisect_right(distances, end)]:
+                if not skip(enemy):
+                    return enemy
+        return None
+
+    def _table(self, strategy: str) -> HealthTable:
+        table = self._tables.get(strategy)
+        if table is None:
+            health = np.fromiter((enemy.health for enemy in self.order), np.float64, len(self.order))
+            keys = health if strategy == 'strongest' else -health
+            table = self._tables[strategy] = HealthTable(keys, np.array(self.positions, dtype=np.int64))
+        return table
+
+    def _best_in_range(self, table: HealthTable, turret, skip: Callable[[object], bool]):
+        # Best enemy of every covered slice; a skipped one splits its slice in
+        # two around it, so k skipped enemies cost O(k log n)
+        distances = self.distances
+        frontier = []
+        for start, end in turret.coverage:
+            lo = bisect_left(distances, start)
+            hi = bisect_right(distances, end)
+            if hi > lo:
+                best = table.best(lo, hi)
+                frontier.append((table.rank(best), best, lo, hi))
+        heapq.heapify(frontier)
+        while frontier:
+            _, best, lo, hi = heapq.heappop(frontier)
+            enemy = self.order[best]
+            if not skip(enemy):
+                return enemy
+            for lo, hi in ((lo, best), (best + 1, hi)):
+                if hi > lo:
+                    split = table.best(lo, hi)
+                    heapq.heappush(frontier, (table.rank(split), split, lo, hi))
+        return None
+
+
+def _insertion_pass(order: list, keys: list):
+    # Sorts ``order`` by ``keys`` in place; O(n) plus one step per overtake
+    for i in range(1, len(keys)):
+        key = keys[i]
+        if keys[i - 1] <= key:
+            continue
+        enemy = order[i]
+        j = i
+        while j > 0 and keys[j - 1] > key:
+            keys[j] = keys[j - 1]
+            order[j] = order[j - 1]
+            j -= 1
+        keys[j] = key
+        order[j] = enemy
@@ -0,0 +1,30 @@
+import heapq
+import itertools
+
+
+class EventScheduler:
+    """Min-heap of timed events; each tick pops only the ones that are due.
+
+    Events scheduled for the same time come out in the order they were added,
+    so runs stay deterministic.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, object]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, time: float, event):
+        heapq.heappush(self._heap, (time, next(self._counter), event))
+
+    def next_time(self) -> float | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list:
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap)[2])
+        return due
@@ -0,0 +1,41 @@
+from game.simulation import Simulation
+
+
+class GameSession:
+    """One game's settings and state, with nothing shared between sessions.
+
+    The session owns the chosen seed and difficulty and a Simulation, which
+    in turn owns the RNG, map, waves and turrets. Sessions never touch the
+    process-wide ``random`` module or module-level state, so any number of
+    them can run side by side in one process or on a thread pool. ``main.py``
+    keeps one for the window and resets it when a new game starts.
+    """
+
+    def __init__(self, seed: int = None, difficulty: str = 'Medium', **options):
+        self.seed = seed
+        self.difficulty = difficulty
+        # Extra Simulation keyword arguments (vectorized, target_index, ...)
+        self.options = options
+        self.simulation = Simulation(seed, difficulty, **options)
+        self.selected_turret = None  # Turret whose sell/upgrade menu is open
+
+    def reset(self):
+        """Start a fresh game with the current seed and difficulty."""
+        self.simulation = Simulation(self.seed, self.difficulty, **self.options)
+        self.selected_turret = None
+
+    def run(self, ticks: int) -> dict:
+        self.simulation.step(ticks)
+        return self.summary()
+
+    def summary(self) -> dict:
+        simulation = self.simulation
+        return {
+            'seed': self.seed,
+            'difficulty': self.difficulty,
+            'waves': simulation.wave_index,
+            'score': simulation.stats.score,
+            'gold': simulation.stats.gold,
+            'health': simulation.stats.health,
+            'ticks': simulation.ticks,
+        }
@@ -0,0 +1,204 @@
+import random
+from typing import Callable, Type
+
+from config import FPS
+from enemies.enemy import Enemy
+from enemies.enemy_store import EnemyStore
+from game.game_map import GameMap
+from game.distance_matrix import DistanceMatrix
+from game.entity_registry import EntityRegistry
+from game.game_stats import GameStats
+from game.path import compile_path
+from game.progress_index import ProgressIndex
+from game.spatial_hash import SpatialHash
+from game.status_effects import StatusEffects
+from game.target_assigner import TargetAssigner
+from game.turret_scheduler import TurretScheduler
+from game.wave import EnemyEvent, Wave, generate_wave
+from game.wave_scheduler import WaveScheduler
+from turrets.analytic_projectiles import AnalyticProjectiles
+from turrets.projectile_pool import ProjectilePool
+from turrets.turret import Turret
+
+# 'auto' switches from scanning the enemy list to the ProgressIndex at this
+# many turrets. From benchmarks/bench_targeting.py: with two turrets the
+# index takes 0.35-0.8x the time of the original sqrt scan, for 10 to 1000
+# enemies; with one it only wins once there are about 50 enemies.
+AUTO_INDEX_TURRETS = 2
+
+
+class Simulation:
+    """Fixed-timestep game state that never reads the wall clock.
+
+    Every call to ``step`` advances the game by whole ticks of ``dt`` simulated
+    seconds, so a given seed produces the same game whether it is rendered at
+    60 FPS or stepped as fast as the CPU allows. Nothing here imports pygame.
+    """
+
+    def __init__(
+        self,
+        seed: int = None,
+        difficulty: str = 'Medium',
+        dt: float = 1 / FPS,
+        vectorized: bool = False,
+        target_index: str = 'auto',
+        projectile_mode: str = 'pooled',
+        early_call: float | None = None,
+        sleep_turrets: bool = True,
+    ):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.dt = dt
+        # Keep enemies in NumPy columns instead of one object per enemy
+        self.vectorized = vectorized
+        # How turrets find enemies in range: 'coverage' (path intervals),
+        # 'grid' (spatial hash), 'matrix' (batched NumPy distances), 'brute',
+        # or 'auto' to use path intervals once there are enough turrets to
+        # amortise the sort (with vectorized, the EnemyStore scans its columns)
+        self.target_index = target_index
+        self.rng = random.Random(seed)
+        self.game_map = GameMap(self.rng)
+        self.stats = GameStats()
+        self.turrets: list[Turret] = []
+        # Integer handles for every live enemy, turret and projectile
+        self.registry = EntityRegistry()
+        # Waves may overlap: all their enemies share one container, and the
+        # next wave can be called early by time or with send_next_wave
+        self.waves = WaveScheduler(
+            self._generate_wave,
+            self.game_map.path,
+            self.stats,
+            EnemyStore(self.game_map.path) if vectorized else None,
+            early_call,
+            self.registry,
+        )
+        self.spatial_hash = SpatialHash(self.game_map.grid_size)
+        self.progress_index = ProgressIndex()
+        self.distance_matrix = DistanceMatrix()
+        # Slows and damage over time from every turret, resolved once per tick
+        self.status_effects = StatusEffects()
+        # Damage in flight per enemy, so turrets don't waste shots on doomed ones
+        self.target_assigner = TargetAssigner()
+        self.waves.subscribe(self.target_assigner.forget_removed)
+        # Projectiles shared by every turret: 'pooled' simulates their flight in
+        # one array pass, 'analytic' only schedules the impact, and 'list' keeps
+        # the per-turret Projectile objects
+        self.projectiles = None
+        if projectile_mode == 'pooled':
+            self.projectiles = ProjectilePool(assigner=self.target_assigner, registry=self.registry)
+        elif projectile_mode == 'analytic':
+            self.projectiles = AnalyticProjectiles(assigner=self.target_assigner, registry=self.registry)
+        # Skip turrets that no enemy can reach yet
+        self.turret_scheduler = TurretScheduler(dt) if sleep_turrets else None
+        self.ticks = 0
+
+    @property
+    def time(self) -> float:
+        return self.ticks * self.dt
+
+    @property
+    def wave_index(self) -> int:
+        return self.waves.wave_index
+
+    @property
+    def enemies(self) -> 'list[Enemy] | EnemyStore':
+        return self.waves.enemies
+
+    def is_game_over(self) -> bool:
+        return self.stats.is_game_over()
+
+    def send_next_wave(self) -> Wave:
+        return self.waves.send_next_wave()
+
+    def step(self, n_ticks: int = 1):
+        for _ in range(n_ticks):
+            if self.stats.is_game_over():
+                break
+            enemies = self._target_index()
+            turrets = self.turrets
+            if self.turret_scheduler is not None:
+                turrets = self.turret_scheduler.awake(turrets, self.ticks, self.waves)
+            for turret in turrets:
+                turret.update(enemies, self.dt)
+            if self.turret_scheduler is not None:
+                self.turret_scheduler.sleep_idle(turrets, self.ticks, self.waves)
+            self.status_effects.resolve(self.waves.enemies, self.dt, self.waves.enemy_store)
+            if self.projectiles is not None:
+                self.projectiles.update(self.dt)
+            self.waves.update(self.dt)
+            self.ticks += 1
+
+    def update_path(self, new_path: list[tuple[int, int]]):
+        new_path = compile_path(new_path)
+        self.game_map.path = new_path
+        self.game_map.grid = self.game_map.create_grid()
+        self.game_map.invalidate()
+        self.waves.update_path(new_path)
+        if self.turret_scheduler is not None:
+            self.turret_scheduler.wake_all()
+        for turret in self.turrets:
+            self.game_map.occupy_cell(turret.pos[0], turret.pos[1])
+            turret.set_path(new_path)
+
+    def _target_index(self):
+        # Rebuilt once per tick, before any turret queries it
+        enemies = self.waves.enemies
+        store = self.waves.enemy_store
+        # An EnemyStore answers range and target queries from its own columns
+        if self.target_index == 'coverage' or (
+            self.target_index == 'auto' and store is None and len(self.turrets) >= AUTO_INDEX_TURRETS
+        ):
+            self.progress_index.rebuild(enemies, self.waves.path)
+            return self.progress_index
+        if self.target_index == 'grid':
+            self.spatial_hash.rebuild(enemies)
+            return self.spatial_hash
+        if self.target_index == 'matrix':
+            positions = store.positions() if store is not None else None
+            self.distance_matrix.rebuild(enemies, self.turrets, positions)
+            return self.distance_matrix
+        return enemies
+
+    def subscribe(self, listener: Callable[[list[EnemyEvent]], None]):
+        """Receive every tick's list of killed/leaked enemy events."""
+        self.waves.subscribe(listener)
+
+    def _generate_wave(self, wave_number: int) -> Wave:
+        return generate_wave(wave_number, self.game_map, self.difficulty, seed=self.seed)
+
+    def place_turret(self, turret_type: Type[Turret], x: int, y: int) -> Turret | None:
+        if not self.game_map.is_valid_placement(x, y):
+            return None
+        turret = turret_type(*self.game_map.snap_to_cell(x, y))
+        if not self.stats.can_afford(turret.cost):
+            return None
+        turret.set_path(self.game_map.path)
+        turret.projectile_system = self.projectiles
+        turret.status_effects = self.status_effects
+        turret.target_assigner = self.target_assigner
+        turret.registry = self.registry
+        self.registry.register(turret)
+        self.turrets.append(turret)
+        self.game_map.occupy_cell(x, y)
+        self.stats.spend_gold(turret.cost)
+        return turret
+
+    def sell_turret(self, turret: Turret):
+        refund = int(turret.cost * 0.75)
+        self.stats.gold += refund
+        self.game_map.free_cell(turret.pos[0], turret.pos[1])
+        self.turrets.remove(turret)
+        self.registry.release(turret.handle)
+        if self.turret_scheduler is not None:
+            self.turret_scheduler.forget(turret)
+
+    def upgrade_turret(self, turret: Turret) -> bool:
+        # Do nothing if at max level
+        if hasattr(turret, 'upgrade_level') and turret.upgrade_level >= 2:
+            return False
+        upgrade_cost = turret.get_upgrade_cost()
+        if not self.stats.can_afford(upgrade_cost):
+            return False
+        self.stats.spend_gold(upgrade_cost)
+        turret.upgrade()
+        return True
@@ -0,0 +1,63 @@
+from collections import defaultdict
+
+
+class SpatialHash:
+    """Uniform grid of enemies bucketed by map cell, rebuilt once per tick.
+
+    Turrets ask for the enemies within their range and only the cells
+    overlapping that circle are scanned, using squared distances. Results
+    come back in the same order as the enemy list the hash was built from,
+    so "first enemy in range" targeting is unchanged. Iterating the hash
+    yields every enemy, so it can be passed anywhere an enemy list is expected.
+    """
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.enemies = ()
+        self.cells: dict[tuple[int, int], list] = {}
+
+    def rebuild(self, enemies):
+        cell_size = self.cell_size
+        cells = defaultdict(list)
+        for order, enemy in enumerate(enemies):
+            x, y = enemy.pos
+            cells[(int(x // cell_size), int(y // cell_size))].append((order, enemy, x, y))
+        self.enemies = enemies
+        self.cells = cells
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def __len__(self) -> int:
+        return len(self.enemies)
+
+    def query(self, x: float, y: float, radius: float) -> list:
+        cell_size = self.cell_size
+        radius2 = radius * radius
+        min_cx, max_cx = int((x - radius) // cell_size), int((x + radius) // cell_size)
+        min_cy, max_cy = int((y - radius) // cell_size), int((y + radius) // cell_size)
+        found = []
+        cells = self.cells
+        if len(cells) < (max_cx - min_cx + 1) * (max_cy - min_cy + 1):
+            # Enemies bunch up along the road, so walking the occupied cells
+            # is often cheaper than probing every cell under the circle
+            buckets = [
+                bucket for (cx, cy), bucket in cells.items()
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy
+            ]
+        else:
+            buckets = [
+                cells[(cx, cy)]
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)
+                if (cx, cy) in cells
+            ]
+        for bucket in buckets:
+            for order, enemy, ex, ey in bucket:
+                if (ex - x) ** 2 + (ey - y) ** 2 <= radius2:
+                    found.append((order, enemy))
+        found.sort(key=lambda item: item[0])
+        return [enemy for _, enemy in found]
+
+    def in_range(self, turret) -> list:
+        return self.query(turret.pos[0], turret.pos[1], turret.range)
@@ -0,0 +1,64 @@
+import numpy as np
+
+# How several effects of the same kind on one enemy combine, and the value
+# that means "no effect". 'slow' is a multiplier on base speed, 'dot' is
+# damage per second.
+EFFECT_RULES = {
+    'slow': {'stacking': 'min', 'neutral': 1.0},
+    'dot': {'stacking': 'sum', 'neutral': 0.0},
+}
+
+STACKING = {
+    'min': min,
+    'max': max,
+    'sum': lambda a, b: a + b,
+    'product': lambda a, b: a * b,
+}
+
+
+class StatusEffects:
+    """Per-tick buffer of effects that turrets apply to enemies.
+
+    Turrets only ``add`` effects during their update. ``resolve`` then folds
+    them into each enemy's effective speed and damage in one pass. Stacking
+    follows ``EFFECT_RULES``, so the order in which turrets run no longer
+    matters.
+    """
+
+    def __init__(self, rules: dict = EFFECT_RULES):
+        self.rules = rules
+        self._stack = {kind: STACKING[rule['stacking']] for kind, rule in rules.items()}
+        self.pending: dict[str, dict] = {kind: {} for kind in rules}
+        self._store_slowed = False  # Whether the last resolve slowed any EnemyStore row
+
+    def add(self, enemy, kind: str, value: float):
+        effects = self.pending[kind]
+        current = effects.get(enemy)
+        effects[enemy] = value if current is None else self._stack[kind](current, value)
+
+    def resolve(self, enemies, dt: float, enemy_store=None):
+        slows = self.pending['slow']
+        dots = self.pending['dot']
+        if enemy_store is not None:
+            self._resolve_store(enemy_store, slows, dots, dt)
+        else:
+            neutral = self.rules['slow']['neutral']
+            for enemy in enemies:
+                enemy.speed = enemy.base_speed * slows.get(enemy, neutral)
+            for enemy, dps in dots.items():
+                enemy.health -= dps * dt
+        for effects in self.pending.values():
+            effects.clear()
+
+    def _resolve_store(self, store, slows: dict, dots: dict, dt: float):
+        n = len(store)
+        # Rows are spawned at base speed, so with no slows now or last tick there is nothing to reset
+        if slows or self._store_slowed:
+            factor = np.full(n, self.rules['slow']['neutral'])
+            if slows:
+                factor[[enemy.row for enemy in slows]] = list(slows.values())
+            store.speed[:n] = store.base_speed[:n] * factor
+        self._store_slowed = bool(slows)
+        if dots:
+            # One entry per view, so the rows are distinct
+            store.health[[enemy.row for enemy in dots]] -= np.array(list(dots.values())) * dt
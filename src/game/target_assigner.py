@@ -0,0 +1,32 @@
+class TargetAssigner:
+    """Damage already in flight towards each enemy, so turrets skip doomed ones.
+
+    A turret reserves its damage when it fires and the projectile system
+    releases it on impact or when the projectile is retired. An enemy whose
+    pending damage covers its remaining health is as good as dead, and
+    shooting it again would only be overkill.
+    """
+
+    def __init__(self):
+        self.pending: dict[object, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def reserve(self, enemy, damage: float):
+        self.pending[enemy] = self.pending.get(enemy, 0) + damage
+
+    def release(self, enemy, damage: float):
+        remaining = self.pending.get(enemy, 0) - damage
+        if remaining > 0:
+            self.pending[enemy] = remaining
+        else:
+            self.pending.pop(enemy, None)
+
+    def is_doomed(self, enemy) -> bool:
+        return self.pending.get(enemy, 0) >= enemy.health
+
+    def forget_removed(self, events: list):
+        # Subscribed to the wave event stream: killed or leaked enemies need no bookkeeping
+        for event in events:
+            self.pending.pop(event.enemy, None)
@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+
+from config import FPS
+
+FOREVER = 1 << 30  # Ticks; only a new wave or path change wakes the turret
+
+
+class TurretScheduler:
+    """Puts idle turrets to sleep until an enemy could possibly reach them.
+
+    After a tick, every idle turret with nothing on its stretch of road
+    (``Turret.coverage``) gets a wake-up tick: the soonest any live enemy, or
+    any enemy still waiting to spawn, could cover the gap to one of its
+    coverage intervals moving at the fastest enemy speed around. Enemies only
+    ever move forward, so until then the turret has nothing to do and is not
+    ticked. Starting a wave or changing the path wakes everything.
+    """
+
+    def __init__(self, dt: float = 1 / FPS):
+        self.dt = dt
+        self.wake_tick: dict = {}  # Sleeping turret -> first tick it runs again
+        self.wave_index = None
+
+    def __len__(self) -> int:
+        return len(self.wake_tick)
+
+    def wake_all(self):
+        self.wake_tick.clear()
+
+    def forget(self, turret):
+        self.wake_tick.pop(turret, None)
+
+    def awake(self, turrets: list, tick: int, waves: 'WaveScheduler') -> list:
+        # A new wave brings spawns nobody planned for
+        if waves.wave_index != self.wave_index:
+            self.wave_index = waves.wave_index
+            self.wake_all()
+        wake_tick = self.wake_tick
+        awake = []
+        for turret in turrets:
+            if wake_tick.get(turret, tick) <= tick:
+                wake_tick.pop(turret, None)
+                awake.append(turret)
+        return awake
+
+    def sleep_idle(self, turrets: list, tick: int, waves: 'WaveScheduler'):
+        """Schedule a wake-up for each idle turret among ``turrets``."""
+        idle = [turret for turret in turrets if turret.path is not None and turret.is_idle()]
+        if not idle:
+            return
+        distances, speed, spawn_ticks = self._snapshot(waves)
+        if speed <= 0:
+            # Nothing alive or left to spawn: sleep until the next wave starts
+            for turret in idle:
+                self.wake_tick[turret] = tick + FOREVER
+            return
+        step = speed * self.dt * FPS  # Furthest any enemy moves in one tick
+        for turret in idle:
+            sleep = self._ticks_until_reachable(turret.coverage, distances, step, spawn_ticks)
+            if sleep > 1:
+                self.wake_tick[turret] = tick + sleep
+
+    def _snapshot(self, waves: 'WaveScheduler') -> tuple[np.ndarray, float, int | None]:
+        # Sorted live distances, the fastest base speed of anything live or
+        # still to spawn, and how many ticks until the next spawn
+        store = waves.enemy_store
+        if store is not None:
+            n = len(store)
+            distances = np.sort(store.distance[:n])
+            speed = float(store.base_speed[:n].max()) if n else 0.0
+        else:
+            enemies = waves.enemies
+            distances = np.sort(np.fromiter((enemy.distance for enemy in enemies), np.float64, len(enemies)))
+            speed = max((enemy.base_speed for enemy in enemies), default=0.0)
+        for wave in waves.waves:
+            if wave.spawned < wave.num_enemies:
+                speed = max(speed, float(wave.timeline.speed[wave.spawned:].max()))
+        next_spawn = waves.spawn_queue.next_time()
+        spawn_ticks = None
+        if next_spawn is not None:
+            spawn_ticks = max(int((next_spawn - waves.time) / self.dt) - 1, 0)
+        return distances, speed, spawn_ticks
+
+    @staticmethod
+    def _ticks_until_reachable(coverage, distances: np.ndarray, step: float, spawn_ticks: int | None) -> int:
+        # One pixel of slack absorbs rounding between coverage and the circle test
+        sleep = math.inf
+        for start, end in coverage:
+            behind = int(np.searchsorted(distances, start - 1.0, side='left'))
+            if behind < len(distances) and distances[behind] <= end + 1.0:
+                return 0  # Something is already in range
+            if behind > 0:
+                gap = start - 1.0 - distances[behind - 1]
+                sleep = min(sleep, int(gap // step))
+            if spawn_ticks is not None:
+                sleep = min(sleep, spawn_ticks + int(max(start - 1.0, 0.0) // step))
+        return sleep if sleep != math.inf else FOREVER
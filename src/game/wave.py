@@ -1,64 +1,102 @@
-import time
-from typing import Type
+from typing import NamedTuple
 
-import pygame
+import numpy as np
 
-from enemies.enemy import Enemy
+from enemies.enemy import Enemy, DynamicEnemy
+from game.wave_definitions import SpawnTimeline, compile_waves
+
+
+class EnemyEvent(NamedTuple):
+    kind: str  # 'killed' or 'leaked'
+    enemy: Enemy
+    gold: int
+    score: int
+    damage: int  # Damage dealt to the player, only for leaks
 
 
 class Wave:
-    def __init__(
-        self,
-        path: list[tuple[int, int]],
-        num_enemies: int,
-        spawn_delay: int | float,
-        enemy_type: Type[Enemy],
-        game_stats: 'GameStats',
-    ):
-        self.enemies: list[Enemy] = []
-        self.spawn_time = time.time()
-        self.spawn_delay = spawn_delay
-        self.num_enemies = num_enemies
-        self.spawned = 0
+    """One wave's spawn timeline and a cursor into it.
+
+    The enemies themselves, their movement and their kill/leak events live
+    in ``WaveScheduler``; a wave only says who spawns when.
+    """
+
+    def __init__(self, path: list[tuple[int, int]], timeline: SpawnTimeline):
+        self.timeline = timeline
+        self.num_enemies = len(timeline)
+        self.spawned = 0  # Cursor into the timeline
+        self.start_time = 0.0
         self.path = path
-        self.enemy_type = enemy_type
-        self.game_stats = game_stats
-
-    def update(self):
-        current_time = time.time()
-        if (
-            self.spawned < self.num_enemies
-            and current_time - self.spawn_time > self.spawn_delay
-        ):
-            self.enemies.append(self.enemy_type(self.path))
-            self.spawned += 1
-            self.spawn_time = current_time
-
-        for enemy in self.enemies:
-            enemy.move()
-            # Check if enemy reached the end
-            if enemy.reached_end:
-                self.game_stats.take_damage(enemy.damage)
-                enemy.health = 0  # Remove the enemy
-
-        # Check for dead enemies and award gold
-        for enemy in self.enemies:
-            if enemy.health <= 0 and not enemy.reached_end:
-                self.game_stats.add_gold(enemy.gold_value)
-                self.game_stats.add_score(enemy.score_value)
-        
-        # Filter out dead enemies
-        self.enemies = [enemy for enemy in self.enemies if enemy.health > 0]
-
-    def draw(self, screen: pygame.Surface):
-        for enemy in self.enemies:
-            enemy.draw(screen)
-
-    def is_finished(self):
-        return (self.spawned == self.num_enemies) and (len(self.enemies) == 0)
-
-    def update_path(self, new_path: list[tuple[int, int]]):
-        self.path = new_path
-        # Update all existing enemies with new path
-        for enemy in self.enemies:
-            enemy.path = new_path
+
+    def next_spawn_time(self) -> float | None:
+        if self.spawned == self.num_enemies:
+            return None
+        return self.start_time + self.timeline.times[self.spawned]
+
+    def due(self, now: float) -> slice:
+        """Advance the cursor past every spawn due by ``now``; the timeline rows passed."""
+        start = self.spawned
+        end = max(int(np.searchsorted(self.timeline.times, now - self.start_time, side='right')), start)
+        self.spawned = end
+        return slice(start, end)
+
+    def spawn_due(self, now: float) -> list[Enemy]:
+        """Build an Enemy for every spawn due by ``now``, possibly several."""
+        timeline = self.timeline
+        due = self.due(now)
+        return [
+            DynamicEnemy(self.path, speed, health, size, tuple(color), gold, gold)
+            for speed, health, size, color, gold in zip(
+                timeline.speed[due].tolist(),
+                timeline.health[due].tolist(),
+                timeline.size[due].tolist(),
+                timeline.color[due].tolist(),
+                timeline.gold[due].tolist(),
+            )
+        ]
+
+
+def advance_enemies(enemies: list[Enemy], dt: float) -> list[EnemyEvent]:
+    # One pass: move, then swap-remove anything killed or leaked
+    events = []
+    i = 0
+    while i < len(enemies):
+        enemy = enemies[i]
+        enemy.move(dt)
+        if enemy.reached_end:
+            events.append(EnemyEvent('leaked', enemy, 0, 0, enemy.damage))
+        elif enemy.health <= 0:
+            events.append(EnemyEvent('killed', enemy, enemy.gold_value, enemy.score_value, 0))
+        else:
+            i += 1
+            continue
+        # The last enemy takes this slot and is processed next
+        enemies[i] = enemies[-1]
+        enemies.pop()
+    return events
+
+
+def advance_store(store: 'EnemyStore', dt: float) -> list[EnemyEvent]:
+    # Same lifecycle as advance_enemies, one vectorized pass over the columns
+    store.move(dt)
+    n = len(store)
+    reached = store.reached_end[:n]
+    gone = reached | (store.health[:n] <= 0)
+    events = []
+    if gone.any():
+        for row in np.flatnonzero(gone).tolist():
+            enemy = store.view(row)
+            if reached[row]:
+                events.append(EnemyEvent('leaked', enemy, 0, 0, int(store.damage[row])))
+            else:
+                events.append(EnemyEvent(
+                    'killed', enemy, int(store.gold_value[row]), int(store.score_value[row]), 0
+                ))
+        store.compact(~gone)
+    return events
+
+
+def generate_wave(wave_number, game_map, difficulty, seed=None):
+    # Wave contents come from waves.json, compiled once per (difficulty, seed)
+    timeline = compile_waves(difficulty, seed).timeline(wave_number)
+    return Wave(game_map.path, timeline)
@@ -0,0 +1,110 @@
+import json
+import os
+import random
+import threading
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+WAVES_FILE = os.path.join(os.path.dirname(__file__), 'waves.json')
+PRECOMPILED_WAVES = 30  # Waves compiled up front; later ones on first use
+
+
+class SpawnTimeline(NamedTuple):
+    """One wave flattened into parallel arrays, sorted by spawn time."""
+    times: np.ndarray  # Seconds after the wave starts
+    health: np.ndarray
+    speed: np.ndarray
+    size: np.ndarray
+    color: np.ndarray  # (n, 3)
+    gold: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+def scaled(spec: list, wave_number: int) -> float:
+    # [base, per_wave] or [base, per_wave, limit]: linear in the wave number,
+    # stopping at the limit in whichever direction it grows
+    value = spec[0] + spec[1] * wave_number
+    if len(spec) > 2:
+        value = min(value, spec[2]) if spec[1] >= 0 else max(value, spec[2])
+    return value
+
+
+def load_wave_definitions(path: str = WAVES_FILE) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+class CompiledWaves:
+    """Spawn timelines for one (difficulty, seed), compiled once and reused.
+
+    Groups may set ``jitter`` (a fraction of their interval) to randomise
+    spawn times; the seed makes that jitter reproducible.
+    """
+
+    def __init__(self, definitions: dict, difficulty: str, seed: int = None):
+        self.definitions = definitions
+        self.difficulty = difficulty
+        self.seed = seed
+        self.multipliers = definitions['difficulties'].get(
+            difficulty, definitions['difficulties']['Medium']
+        )
+        self.timelines: list[SpawnTimeline] = []
+        # Shared by every session with this (difficulty, seed), possibly across threads
+        self._lock = threading.Lock()
+        for wave_number in range(PRECOMPILED_WAVES):
+            self.timeline(wave_number)
+
+    def timeline(self, wave_number: int) -> SpawnTimeline:
+        if wave_number >= len(self.timelines):
+            with self._lock:
+                while len(self.timelines) <= wave_number:
+                    self.timelines.append(self._compile(len(self.timelines)))
+        return self.timelines[wave_number]
+
+    def _pattern(self, wave_number: int) -> dict:
+        # First pattern whose every/offset matches; one without "every" matches all
+        for pattern in self.definitions['waves']:
+            every = pattern.get('every')
+            if every is None or wave_number % every == pattern.get('offset', 0):
+                return pattern
+        raise ValueError(f"No wave pattern matches wave {wave_number}")
+
+    def _compile(self, wave_number: int) -> SpawnTimeline:
+        rng = random.Random(f"{self.seed}:{self.difficulty}:{wave_number}")
+        mult = self.multipliers
+        columns = {name: [] for name in SpawnTimeline._fields}
+        for group in self._pattern(wave_number)['groups']:
+            archetype = self.definitions['archetypes'][group['archetype']]
+            count = int(scaled(group['count'], wave_number) * mult['count'])
+            interval = scaled(group['interval'], wave_number)
+            jitter = group.get('jitter', 0.0) * interval
+            start = group.get('delay', 0.0)
+            color = next(
+                color for first_wave, color in reversed(archetype['colors']) if wave_number >= first_wave
+            )
+            for i in range(1, count + 1):
+                offset = rng.uniform(-jitter, jitter) if jitter else 0.0
+                columns['times'].append(start + i * interval + offset)
+            columns['health'] += [int(scaled(archetype['health'], wave_number) * mult['health'])] * count
+            columns['speed'] += [scaled(archetype['speed'], wave_number) * mult['speed']] * count
+            columns['size'] += [int(scaled(archetype['size'], wave_number))] * count
+            columns['color'] += [color] * count
+            columns['gold'] += [int(scaled(archetype['gold'], wave_number))] * count
+        order = np.argsort(np.array(columns['times'], dtype=np.float64), kind='stable')
+        return SpawnTimeline(
+            times=np.array(columns['times'], dtype=np.float64)[order],
+            health=np.array(columns['health'], dtype=np.int64)[order],
+            speed=np.array(columns['speed'], dtype=np.float64)[order],
+            size=np.array(columns['size'], dtype=np.int64)[order],
+            color=np.array(columns['color'], dtype=np.int64).reshape(-1, 3)[order],
+            gold=np.array(columns['gold'], dtype=np.int64)[order],
+        )
+
+
+@lru_cache(maxsize=32)
+def compile_waves(difficulty: str, seed: int = None) -> CompiledWaves:
+    return CompiledWaves(load_wave_definitions(), difficulty, seed)
@@ -0,0 +1,134 @@
+from typing import Callable
+
+from config import FPS
+from enemies.enemy import Enemy
+from enemies.sprites import draw_sprites
+from game.path import compile_path
+from game.scheduler import EventScheduler
+from game.wave import EnemyEvent, Wave, advance_enemies, advance_store
+
+
+class WaveScheduler:
+    """Runs any number of waves at once over one shared enemy container.
+
+    Every running wave's next spawn sits in a single time-ordered queue, and every
+    live enemy, whichever wave it came from, lives in one list (or one
+    ``EnemyStore``, filled straight from the wave timelines), so turrets query
+    a single collection. The next wave
+    starts when all running waves are cleared, when ``send_next_wave`` is
+    called, or ``early_call`` seconds after the newest wave finished spawning.
+    """
+
+    def __init__(
+        self,
+        make_wave: Callable[[int], Wave],
+        path: list[tuple[int, int]],
+        game_stats: 'GameStats',
+        enemy_store: 'EnemyStore' = None,
+        early_call: float | None = None,
+        registry: 'EntityRegistry' = None,
+    ):
+        self.make_wave = make_wave
+        self.path = compile_path(path)
+        self.enemy_store = enemy_store
+        self.early_call = early_call
+        # Spawned enemies get a handle here and lose it when killed or leaked;
+        # EnemyStore rows get one when a turret first targets them
+        self.registry = registry
+        self._enemies: list[Enemy] = []
+        self.spawn_queue = EventScheduler()
+        self.waves: list[Wave] = []  # Running waves, oldest first
+        self.wave_index = -1  # Number of the newest wave started
+        self.time = 0.0
+        self.last_spawn_time = 0.0  # When the newest wave's final enemy is due
+        self._owner: dict[Enemy | int, Wave] = {}  # Keyed by Enemy, or by uid in the store
+        self._alive: dict[Wave, int] = {}
+        # Enemies killed or leaked during the last update, across all waves
+        self.events: list[EnemyEvent] = []
+        self.listeners: list[Callable[[list[EnemyEvent]], None]] = []
+        self.subscribe(game_stats.apply_events)
+        self.send_next_wave()
+
+    @property
+    def enemies(self) -> 'list[Enemy] | EnemyStore':
+        if self.enemy_store is not None:
+            return self.enemy_store
+        return self._enemies
+
+    def subscribe(self, listener: Callable[[list[EnemyEvent]], None]):
+        self.listeners.append(listener)
+
+    def send_next_wave(self) -> Wave:
+        """Start the next wave now, alongside any that are still running."""
+        self.wave_index += 1
+        wave = self.make_wave(self.wave_index)
+        wave.path = self.path
+        wave.start_time = self.time
+        # One queue entry per wave, keyed by its next spawn; the wave's own
+        # cursor releases everything due when the entry comes up
+        if wave.num_enemies:
+            self.spawn_queue.schedule(wave.next_spawn_time(), wave)
+            self.last_spawn_time = self.time + wave.timeline.times[-1]
+        else:
+            self.last_spawn_time = self.time
+        self.waves.append(wave)
+        self._alive[wave] = 0
+        return wave
+
+    def update(self, dt: float = 1 / FPS):
+        self.time += dt
+        for wave in self.spawn_queue.pop_due(self.time):
+            if self.enemy_store is not None:
+                uids = self.enemy_store.spawn(wave.timeline, wave.due(self.time)).tolist()
+                self._owner.update(dict.fromkeys(uids, wave))
+                self._alive[wave] += len(uids)
+            else:
+                for enemy in wave.spawn_due(self.time):
+                    self._enemies.append(enemy)
+                    if self.registry is not None:
+                        self.registry.register(enemy)
+                    self._owner[enemy] = wave
+                    self._alive[wave] += 1
+            if wave.next_spawn_time() is not None:
+                self.spawn_queue.schedule(wave.next_spawn_time(), wave)
+
+        if self.enemy_store is not None:
+            self.events = advance_store(self.enemy_store, dt)
+        else:
+            self.events = advance_enemies(self._enemies, dt)
+        for event in self.events:
+            owner = event.enemy.uid if self.enemy_store is not None else event.enemy
+            self._alive[self._owner.pop(owner)] -= 1
+        if self.events:
+            for listener in self.listeners:
+                listener(self.events)
+            if self.registry is not None:
+                self.registry.release_removed(self.events)
+
+        for wave in [wave for wave in self.waves if self.is_wave_finished(wave)]:
+            self.waves.remove(wave)
+            del self._alive[wave]
+        if not self.waves or (
+            self.early_call is not None and self.time >= self.last_spawn_time + self.early_call
+        ):
+            self.send_next_wave()
+
+    def is_wave_finished(self, wave: Wave) -> bool:
+        return wave.spawned == wave.num_enemies and self._alive[wave] == 0
+
+    def update_path(self, new_path: list[tuple[int, int]]):
+        new_path = compile_path(new_path)
+        self.path = new_path
+        for wave in self.waves:
+            wave.path = new_path
+        if self.enemy_store is not None:
+            self.enemy_store.set_path(new_path)
+        # Re-map existing enemies to the nearest point on the new path
+        for enemy in self._enemies:
+            enemy.distance = new_path.project(*enemy.pos)
+            enemy.path = new_path
+
+    def draw(self, screen: 'pygame.Surface') -> list['pygame.Rect']:
+        if self.enemy_store is not None:
+            return self.enemy_store.draw(screen)
+        return draw_sprites(screen, [sprite for enemy in self._enemies for sprite in enemy.sprites()])
@@ -1,21 +1,22 @@
 import pygame
 from typing import Optional
 from config import WIDTH, HEIGHT, GRAY, BLACK, BLUE
+from text_cache import render_text
 
 class DifficultyMenu:
     def __init__(self):
         self.options = ["Easy", "Medium", "Nightmare"]
         self.selected = 0
-        self.font = pygame.font.Font(None, 60)
-        self.title_font = pygame.font.Font(None, 70)
+        self.font_size = 60
+        self.title_size = 70
 
     def draw(self, screen):
         screen.fill(GRAY)
-        title_text = self.title_font.render("Select Difficulty", True, BLACK)
+        title_text = render_text("Select Difficulty", self.title_size, BLACK)
         screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, 100))
         for i, option in enumerate(self.options):
             color = BLUE if i == self.selected else BLACK
-            text = self.font.render(option, True, color)
+            text = render_text(option, self.font_size, color)
             screen.blit(text, (WIDTH // 2 - text.get_width() // 2, 250 + i * 80))
         pygame.display.flip()
 
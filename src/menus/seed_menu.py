@@ -1,24 +1,25 @@
 import pygame
 from typing import Optional
 from config import WIDTH, HEIGHT, GRAY, BLACK, BLUE
+from text_cache import render_text
 import random
 
 class SeedMenu:
     def __init__(self):
         self.input_str = ''
-        self.font = pygame.font.Font(None, 60)
-        self.title_font = pygame.font.Font(None, 70)
-        self.info_font = pygame.font.Font(None, 36)
+        self.font_size = 60
+        self.title_size = 70
+        self.info_size = 36
         self.confirmed = False
         self.seed = None
 
     def draw(self, screen):
         screen.fill(GRAY)
-        title_text = self.title_font.render("Enter Seed (optional)", True, BLACK)
+        title_text = render_text("Enter Seed (optional)", self.title_size, BLACK)
         screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, 100))
-        input_text = self.font.render(self.input_str or ' ', True, BLUE)
+        input_text = render_text(self.input_str or ' ', self.font_size, BLUE)
         screen.blit(input_text, (WIDTH // 2 - input_text.get_width() // 2, 220))
-        info_text = self.info_font.render("Press Enter to confirm, or leave blank for random", True, BLACK)
+        info_text = render_text("Press Enter to confirm, or leave blank for random", self.info_size, BLACK)
         screen.blit(info_text, (WIDTH // 2 - info_text.get_width() // 2, 320))
         pygame.display.flip()
 
@@ -0,0 +1,202 @@
+"""Search turret placements and upgrade timing for one seed with headless rollouts.
+
+Run from ``src/``::
+
+    python optimize_placement.py 42 --difficulty Nightmare --depth 6 --beam 4
+
+A candidate is a set of turrets pinned to grid cells plus the upgrade
+timing: for each ``upgrade`` step, how many turrets are built before it.
+It is played as a build order with the cheapest turrets first, each step
+as soon as it is affordable. Beam search grows the best candidates one
+turret or upgrade at a time and keeps those with the most waves survived
+per gold spent. Rollouts run on a process pool. Results are cached per
+(seed, difficulty, placement set, upgrade timing), so a candidate reached
+along different paths is simulated only once. A rollout stops early once
+even surviving every remaining wave could not beat the best score so far.
+"""
+import argparse
+import multiprocessing
+import random
+import time
+from functools import partial
+
+from config import FPS
+from game.build_order import TURRET_TYPES, UPGRADE, BuildOrder, placement
+from game.game_map import GameMap
+from game.simulation import Simulation
+
+
+def candidate_cells(seed: int, count: int) -> list[tuple[int, int]]:
+    # Free cells covering the most road at the smallest turret range; any
+    # turret placed there is in the thick of it
+    game_map = GameMap(random.Random(seed))
+    turret_range = min(turret_type(0, 0).range for turret_type in TURRET_TYPES.values())
+    size = game_map.grid_size
+    scored = []
+    for row, cells in enumerate(game_map.grid):
+        for col, free in enumerate(cells):
+            if free:
+                x, y = col * size + size // 2, row * size + size // 2
+                cover = sum(end - start for start, end in game_map.path.coverage(x, y, turret_range))
+                if cover > 0:
+                    scored.append((-cover, row, col))
+    scored.sort()
+    return [(col, row) for _, row, col in scored[:count]]
+
+
+Candidate = tuple[frozenset[str], tuple[int, ...]]  # (placements, turrets built before each upgrade)
+TURRET_COSTS = {name: turret_type(0, 0).cost for name, turret_type in TURRET_TYPES.items()}
+
+
+def build_order(candidate: Candidate) -> tuple[str, ...]:
+    # Cheapest turrets first so the defence is up as early as possible; ties by cell
+    placements, upgrades = candidate
+    ordered = sorted(placements, key=lambda action: (TURRET_COSTS[action.partition('@')[0]], action))
+    actions = [UPGRADE] * upgrades.count(0)
+    for built, action in enumerate(ordered, 1):
+        actions.append(action)
+        actions += [UPGRADE] * upgrades.count(built)
+    return tuple(actions)
+
+
+def rollout(
+    actions: tuple[str, ...],
+    seed: int,
+    difficulty: str,
+    max_waves: int,
+    max_ticks: int,
+    best: float,
+) -> dict:
+    """Play ``actions`` until game over or ``max_waves``; stop once it cannot beat ``best``."""
+    simulation = Simulation(seed, difficulty, projectile_mode='analytic')
+    builder = BuildOrder(list(actions))
+    spent = 0
+    while simulation.ticks < max_ticks and not simulation.is_game_over():
+        if simulation.wave_index >= max_waves:
+            break
+        gold = simulation.stats.gold
+        builder.apply(simulation)
+        spent += gold - simulation.stats.gold
+        # Surviving every remaining wave is the best this rollout can still do
+        if best > 0 and spent > 0 and max_waves / spent < best:
+            return {'waves': simulation.wave_index, 'spent': spent, 'score': 0.0, 'pruned': True}
+        simulation.step()
+    waves = min(simulation.wave_index, max_waves)
+    return {'waves': waves, 'spent': spent, 'score': waves / max(spent, 1), 'pruned': False}
+
+
+class PlacementSearch:
+    """Beam search over placement sets with a transposition cache of rollouts."""
+
+    def __init__(
+        self,
+        seed: int,
+        difficulty: str,
+        cells: list[tuple[int, int]],
+        max_waves: int,
+        max_ticks: int,
+        pool: 'multiprocessing.pool.Pool',
+    ):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.cells = cells
+        self.max_waves = max_waves
+        self.max_ticks = max_ticks
+        self.pool = pool
+        # (seed, difficulty, placements, upgrade timing) -> rollout result
+        self.cache: dict[tuple, dict] = {}
+        self.rollouts = 0
+        self.best_candidate: Candidate = (frozenset(), ())
+        self.best = {'waves': 0, 'spent': 0, 'score': 0.0, 'pruned': False}
+
+    def expand(self, candidate: Candidate) -> set[Candidate]:
+        placements, upgrades = candidate
+        used = {action.partition('@')[2] for action in placements}
+        children = {
+            (placements | {placement(name, col, row)}, upgrades)
+            for col, row in self.cells
+            if f"{col}:{row}" not in used
+            for name in TURRET_TYPES
+        }
+        if placements:
+            children.add((placements, upgrades + (len(placements),)))
+        return children
+
+    def key(self, candidate: Candidate) -> tuple:
+        return (self.seed, self.difficulty, *candidate)
+
+    def evaluate(self, candidates: list[Candidate]) -> list[dict]:
+        todo = [candidate for candidate in candidates if self.key(candidate) not in self.cache]
+        job = partial(
+            rollout,
+            seed=self.seed,
+            difficulty=self.difficulty,
+            max_waves=self.max_waves,
+            max_ticks=self.max_ticks,
+            best=self.best['score'],
+        )
+        for candidate, result in zip(todo, self.pool.map(job, map(build_order, todo))):
+            self.cache[self.key(candidate)] = result
+        self.rollouts += len(todo)
+        return [self.cache[self.key(candidate)] for candidate in candidates]
+
+    def run(self, depth: int, beam_width: int) -> tuple[tuple[str, ...], dict]:
+        beam: list[Candidate] = [(frozenset(), ())]
+        for level in range(depth):
+            # The same placement set is reached from many parents; it is evaluated once
+            candidates = sorted(
+                {child for candidate in beam for child in self.expand(candidate)}, key=build_order
+            )
+            results = self.evaluate(candidates)
+            ranked = sorted(
+                (
+                    (-result['score'], -result['waves'], build_order(candidate), candidate)
+                    for candidate, result in zip(candidates, results)
+                    if not result['pruned']
+                ),
+                key=lambda entry: entry[:3],
+            )
+            if not ranked:
+                break
+            top = ranked[0][3]
+            result = self.cache[self.key(top)]
+            if result['score'] > self.best['score']:
+                self.best, self.best_candidate = result, top
+            beam = [candidate for *_, candidate in ranked[:beam_width]]
+            print(
+                f"depth {level + 1}: {len(candidates)} candidates, {self.rollouts} rollouts,"
+                f" best {self.best['waves']} waves / {self.best['spent']} gold"
+            )
+        return build_order(self.best_candidate), self.best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('seed', type=int)
+    parser.add_argument('--difficulty', default='Medium', choices=['Easy', 'Medium', 'Nightmare'])
+    parser.add_argument('--depth', type=int, default=6, help="build actions per candidate")
+    parser.add_argument('--beam', type=int, default=4, help="candidates kept per depth")
+    parser.add_argument('--cells', type=int, default=8, help="best road-covering cells to try")
+    parser.add_argument('--max-waves', type=int, default=10, help="rollout horizon in waves")
+    parser.add_argument('--minutes', type=float, default=15, help="rollout horizon in simulated minutes")
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        search = PlacementSearch(
+            args.seed,
+            args.difficulty,
+            candidate_cells(args.seed, args.cells),
+            args.max_waves,
+            int(args.minutes * 60 * FPS),
+            pool,
+        )
+        actions, result = search.run(args.depth, args.beam)
+    print(f"{search.rollouts} rollouts in {time.perf_counter() - started:.1f}s")
+    print(f"best: {result['waves']} waves for {result['spent']} gold")
+    print(f"build order: {','.join(actions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+from enemies.enemy import DynamicEnemy
+from game.entity_registry import EntityRegistry
+from game.path import compile_path
+from turrets import BulletTurret, TeslaTurret
+
+PATH = [(0, 100), (800, 100)]
+
+
+def make_enemies(count: int) -> list:
+    path = compile_path(PATH)
+    enemies = []
+    for i in range(count):
+        enemy = DynamicEnemy(path, 0, 10_000, 10, (0, 0, 255), 10)
+        enemy.distance = 380 + 10 * i
+        enemies.append(enemy)
+    return enemies
+
+
+def test_handle_of_rejects_foreign_handle():
+    first, second = EntityRegistry(), EntityRegistry()
+    enemy = make_enemies(1)[0]
+    handle = first.handle_of(enemy)
+    other = object.__new__(BulletTurret)
+    other.handle = None
+    second.register(other)  # Takes the slot the enemy's handle points at in `second`
+    assert second.get(handle) is other
+    assert second.get(second.handle_of(enemy)) is enemy
+
+
+def test_standalone_bullet_turrets_share_enemies():
+    enemies = make_enemies(3)
+    turrets = [BulletTurret(400, 140), BulletTurret(420, 60)]
+    for _ in range(300):
+        for turret in turrets:
+            turret.update(enemies)  # Used to crash once a handle named the other turret's projectile
+    assert sum(10_000 - enemy.health for enemy in enemies) > 0
+
+
+def test_standalone_tesla_turrets_both_zap():
+    enemies = make_enemies(3)
+    turrets = [TeslaTurret(400, 140), TeslaTurret(420, 60)]
+    for _ in range(3):
+        for turret in turrets:
+            turret.update(enemies)
+    for turret in turrets:
+        assert set(turret.live_targets()) == set(enemies)
+
+
+def test_standalone_turrets_release_dead_enemies():
+    enemies = make_enemies(3)
+    tesla, bullet = TeslaTurret(400, 140), BulletTurret(420, 60)
+    for enemy in enemies:
+        enemy.health = 40  # Tesla alone kills each in four seconds
+    for _ in range(300):
+        for turret in (tesla, bullet):
+            turret.update(enemies)
+    assert all(enemy.health <= 0 for enemy in enemies)
+    # Only the bullet turret's own projectiles may still be registered
+    assert len(tesla.registry) == 0
+    assert len(bullet.registry) == len(bullet.projectiles)
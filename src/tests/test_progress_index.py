@@ -0,0 +1,34 @@
+import random
+
+from enemies.enemy import DynamicEnemy
+from game.path import compile_path
+from game.progress_index import ProgressIndex
+from turrets import BulletTurret
+from turrets.turret import TARGETING
+
+PATH = [(0, 100), (800, 100), (800, 500), (0, 500)]
+
+
+def test_select_matches_brute_force():
+    rng = random.Random(0)
+    path = compile_path(PATH)
+    enemies = [
+        DynamicEnemy(path, rng.uniform(0.5, 3), rng.choice([50, 100, rng.uniform(1, 200)]), 10, (0, 0, 255), 10)
+        for _ in range(200)
+    ]
+    for enemy in enemies:
+        enemy.distance = rng.uniform(0, path.length - 200)
+    turrets = [BulletTurret(x, y) for x, y in ((400, 160), (760, 300), (200, 440), (820, 120))]
+    index = ProgressIndex()
+    for tick in range(40):
+        for enemy in enemies:
+            enemy.move()  # Enemies overtake each other, so the kept order needs fixing up
+        if tick % 5 == 0:
+            enemies.append(enemies.pop(rng.randrange(len(enemies))))
+        doomed = set(rng.sample(enemies, 60)) if tick % 2 else set()
+        index.rebuild(enemies, path)
+        for turret in turrets:
+            for strategy, (pick, key) in TARGETING.items():
+                candidates = [enemy for enemy in turret.enemies_in_range(enemies) if enemy not in doomed]
+                expected = pick(candidates, key=key) if candidates else None
+                assert index.select(turret, strategy, doomed.__contains__) is expected
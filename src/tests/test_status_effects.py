@@ -0,0 +1,23 @@
+from enemies.enemy import DynamicEnemy
+from game.path import compile_path
+from turrets import IceTurret
+
+PATH = [(0, 100), (800, 100)]
+
+
+def test_standalone_ice_turrets_keep_each_others_slow():
+    path = compile_path(PATH)
+    near, far = (DynamicEnemy(path, 2, 10_000, 10, (0, 0, 255), 10) for _ in range(2))
+    near.distance, far.distance = 100, 700
+    enemies = [near, far]
+    first, second = IceTurret(100, 100), IceTurret(700, 100)
+    for _ in range(3):
+        first.update(enemies)
+        second.update(enemies)
+    # Each turret slows its own enemy; the other turret must not reset it
+    assert near.speed == far.speed == near.base_speed * 0.5
+    near.distance = 400  # Out of both ranges: back to full speed
+    first.update(enemies)
+    second.update(enemies)
+    assert near.speed == near.base_speed
+    assert far.speed == far.base_speed * 0.5
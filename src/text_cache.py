@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+MAX_TEXT_SURFACES = 512  # Rendered strings kept before the least recently used is dropped
+
+_fonts: dict[tuple[str | None, int], 'pygame.font.Font'] = {}
+
+
+def get_font(size: int, name: str = None) -> 'pygame.font.Font':
+    """One shared Font per (file name, size); ``None`` is pygame's default font."""
+    font = _fonts.get((name, size))
+    if font is None:
+        font = _fonts[(name, size)] = pygame.font.Font(name, size)
+    return font
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, size, text, color), LRU-evicted.
+
+    The HUD and menus render the same few strings every frame; with the
+    cache they only call ``Font.render`` when a string actually changes.
+    Callers must not draw onto the returned surfaces, they are shared.
+    """
+
+    def __init__(self, capacity: int = MAX_TEXT_SURFACES):
+        self.capacity = capacity
+        self.surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def render(self, text: str, size: int, color: tuple, name: str = None) -> 'pygame.Surface':
+        key = (name, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = get_font(size, name).render(text, True, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(text: str, size: int, color: tuple, name: str = None) -> 'pygame.Surface':
+    """Antialiased ``text`` from the shared cache."""
+    return text_cache.render(text, size, color, name)
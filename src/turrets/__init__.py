@@ -2,3 +2,5 @@ from .bullet_turret import BulletTurret
 from .tesla_turret import TeslaTurret
 from .ice_turret import IceTurret
 from .turret import Turret, Projectile
+from .projectile_pool import ProjectilePool
+from .analytic_projectiles import AnalyticProjectiles
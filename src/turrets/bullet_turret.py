@@ -1,13 +1,15 @@
-import math
-import time
 from turrets.turret import Turret, Projectile
 
+FPS = 60
+
 class BulletTurret(Turret):
+    __slots__ = ('fire_rate', 'cooldown', 'projectiles')
+
     def __init__(self, x: int, y: int):
         super().__init__(x, y)
         self.fire_rate = 0.1
         self.damage = 20
-        self.last_shot = time.time()
+        self.cooldown = self.fire_rate  # Simulated seconds until the next shot
         self.projectiles: list[Projectile] = []
         self.cost = 50  # Specific cost for BulletTurret
         self.upgrade_level = 0
@@ -18,38 +20,44 @@ class BulletTurret(Turret):
         colors = [(120,120,120), (220,40,40), (120,0,0)]
         self.color = colors[min(self.upgrade_level, 2)]
 
-    def shoot(self, enemies: list):
-        current_time = time.time()
-        if current_time - self.last_shot >= self.fire_rate:
-            for enemy in enemies:
-                dist = math.sqrt(
-                    (enemy.pos[0] - self.pos[0]) ** 2
-                    + (enemy.pos[1] - self.pos[1]) ** 2
-                )
-                if dist <= self.range:
+    def shoot(self, enemies: list, dt: float = 1 / FPS):
+        self.cooldown = max(self.cooldown - dt, 0.0)
+        if self.cooldown <= 0:
+            enemy = self.select_target(enemies)
+            if enemy is not None:
+                if self.target_assigner is not None:
+                    self.target_assigner.reserve(enemy, self.damage)
+                if self.projectile_system is not None:
+                    self.projectile_system.launch(self.pos[0], self.pos[1], enemy, self.damage)
+                else:
                     self.projectiles.append(
-                        Projectile(self.pos[0], self.pos[1], enemy, self.damage)
+                        Projectile(
+                            self.pos[0], self.pos[1], enemy, self.damage, self.registry, self.target_assigner
+                        )
                     )
-                    self.last_shot = current_time
-                    break
+                self.cooldown = self.fire_rate
 
-    def update(self, enemies: list):
-        self.shoot(enemies)
+    def update(self, enemies: list, dt: float = 1 / FPS):
+        self.shoot(enemies, dt)
         for projectile in self.projectiles:
-            projectile.move()
+            projectile.move(dt)
         self.projectiles = [p for p in self.projectiles if p.active]
 
+    def is_idle(self) -> bool:
+        return self.cooldown <= 0 and not self.projectiles
+
     def draw(self, screen):
-        super().draw(screen)  # Draw the base turret
+        rect = super().draw(screen)  # Draw the base turret
         # Draw projectiles
-        for projectile in self.projectiles:
-            projectile.draw(screen)
+        return rect.unionall([projectile.draw(screen) for projectile in self.projectiles])
 
     def upgrade(self):
         self.damage *= 2
         if self.upgrade_level < 2:
             self.upgrade_level += 1
         self.set_color()
+        self.sprite = None  # Picked up from the sprite cache for the new level on next draw
+        self.update_coverage()
 
     def get_upgrade_cost(self):
         return 3 * self.cost * (self.upgrade_level + 1) 
\ No newline at end of file
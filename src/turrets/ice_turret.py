@@ -1,17 +1,26 @@
 import math
+
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+from game.status_effects import StatusEffects
 from turrets.turret import Turret
 
 BLUE = (0, 0, 255)
 FPS = 60
 
 class IceTurret(Turret):
+    __slots__ = ('slow_factor', 'targets', 'effect_color', 'effect_width')
+
     def __init__(self, x: int, y: int):
         super().__init__(x, y)
         self.damage = 5  # Lower damage than Tesla
         self.range = 150  # Larger range than other turrets
         self.cost = 100  # Most expensive due to area effect
         self.slow_factor = 0.5  # Slows enemies to 50% speed
-        self.targets = []  # All enemies in range
+        self.targets: set[int] = set()  # Registry handles of all enemies in range
         self.effect_color = (100, 200, 255)  # Changed to light blue for ice effect
         self.effect_width = 2  # Thinner lines than Tesla
         self.upgrade_level = 0
@@ -22,29 +31,29 @@ class IceTurret(Turret):
         colors = [(0,0,255), (0,255,255), (255,255,255)]
         self.color = colors[min(self.upgrade_level, 2)]
 
-    def update(self, enemies: list):
+    def update(self, enemies: list, dt: float = 1 / FPS):
         # Find all enemies in range
-        self.targets = []
-        for enemy in enemies:
-            dist = math.sqrt(
-                (enemy.pos[0] - self.pos[0]) ** 2 + 
-                (enemy.pos[1] - self.pos[1]) ** 2
-            )
-            if dist <= self.range:
-                self.targets.append(enemy)
-                # Apply slow effect
-                enemy.speed = enemy.base_speed * self.slow_factor
-            else:
-                # Reset speed if out of range
-                enemy.speed = enemy.base_speed
-        # Deal damage to all targets
-        for target in self.targets:
-            target.health -= self.damage / FPS
+        targets = self.enemies_in_range(enemies)
+        previous = self.targets
+        self.targets = {self.registry.handle_of(target) for target in targets}
+        # Slow and damage are resolved once per tick for all turrets; a
+        # standalone turret resolves a buffer of its own right away
+        effects = self.status_effects or StatusEffects()
+        for target in targets:
+            effects.add(target, 'slow', self.slow_factor)
+            effects.add(target, 'dot', self.damage)
+        if effects is not self.status_effects:
+            # Only touch enemies this turret slows or slowed last update, so
+            # other turrets' slows are left alone
+            released = [self.registry.get_target(handle) for handle in previous - self.targets]
+            effects.resolve(targets + [enemy for enemy in released if enemy is not None], dt)
 
-    def draw(self, screen):
+    def is_idle(self) -> bool:
+        return not self.targets
+
+    def draw_body(self, surface, center):
         # Draw hexagon for turret
         radius = self.radius
-        center = self.pos
         points = []
         for i in range(6):
             angle = math.pi / 3 * i
@@ -52,10 +61,14 @@ class IceTurret(Turret):
                 center[0] + radius * math.cos(angle),
                 center[1] + radius * math.sin(angle)
             ))
-        import pygame
-        pygame.draw.polygon(screen, self.color, points)
+        return pygame.draw.polygon(surface, self.color, points)
+
+    def draw(self, screen):
+        rect = super().draw(screen)
         # Draw effect lines to all targets
-        for target in self.targets:
+        for target in map(self.registry.get, self.targets):
+            if target is None:
+                continue
             start_pos = self.pos
             end_pos = target.pos
             dx = end_pos[0] - start_pos[0]
@@ -73,13 +86,16 @@ class IceTurret(Turret):
                 ]
                 points.append(point)
             points.append(end_pos)
-            pygame.draw.lines(screen, self.effect_color, False, points, self.effect_width)
+            rect.union_ip(pygame.draw.lines(screen, self.effect_color, False, points, self.effect_width))
+        return rect
 
     def upgrade(self):
         self.damage *= 2
         if self.upgrade_level < 2:
             self.upgrade_level += 1
         self.set_color()
+        self.sprite = None
+        self.update_coverage()
 
     def get_upgrade_cost(self):
         return 3 * self.cost * (self.upgrade_level + 1) 
\ No newline at end of file
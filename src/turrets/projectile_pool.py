@@ -0,0 +1,108 @@
+import numpy as np
+
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+from config import FPS, YELLOW
+from game.entity_registry import EntityRegistry
+
+
+class ProjectilePool:
+    """Preallocated, array-backed storage for every projectile in a simulation.
+
+    Positions, speeds, damage and targets live in fixed arrays; a fired
+    projectile takes a free slot and gives it back on impact, so heavy
+    firefights allocate nothing per shot. ``update`` homes every projectile
+    on its target in one vectorized step. Slots are not registry handles:
+    they never leave the pool, so nothing can hold one past its projectile.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        assigner: 'TargetAssigner' = None,
+        registry: EntityRegistry = None,
+    ):
+        self.assigner = assigner  # Released on impact or retirement when set
+        # Targets are stored as registry handles, so dead enemies aren't kept alive
+        self.registry = registry if registry is not None else EntityRegistry()
+        self.capacity = 0
+        self.pos = np.zeros((0, 2), dtype=np.float64)
+        self.speed = np.zeros(0, dtype=np.float64)
+        self.damage = np.zeros(0, dtype=np.float64)
+        self.target = np.zeros(0, dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)
+        self._free: list[int] = []
+        self._grow(capacity)
+
+    def _grow(self, capacity: int):
+        old = self.capacity
+        self.pos = np.concatenate((self.pos, np.zeros((capacity - old, 2))))
+        self.speed = np.concatenate((self.speed, np.zeros(capacity - old)))
+        self.damage = np.concatenate((self.damage, np.zeros(capacity - old)))
+        self.target = np.concatenate((self.target, np.zeros(capacity - old, dtype=np.int64)))
+        self.active = np.concatenate((self.active, np.zeros(capacity - old, dtype=bool)))
+        # Hand out low slots first so live projectiles stay packed
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    def launch(self, x: float, y: float, target, damage: float, speed: float = 10):
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self.pos[slot] = (x, y)
+        self.speed[slot] = speed
+        self.damage[slot] = damage
+        self.target[slot] = self.registry.handle_of(target)
+        self.active[slot] = True
+
+    def release(self, slot: int):
+        if self.assigner is not None:
+            target = self.registry.get(int(self.target[slot]))
+            if target is not None:
+                self.assigner.release(target, self.damage[slot])
+        self.active[slot] = False
+        self._free.append(slot)
+
+    def update(self, dt: float = 1 / FPS):
+        # Same rules as Projectile.move, applied to every live slot at once
+        if len(self._free) == self.capacity:
+            return
+        slots = np.flatnonzero(self.active)
+        if len(slots) == 0:
+            return
+        # Retire projectiles whose target died or leaked before simulating them
+        get = self.registry.get
+        targets = [get(handle) for handle in self.target[slots].tolist()]
+        gone = [target is None or target.health <= 0 or target.reached_end for target in targets]
+        if any(gone):
+            gone = np.array(gone)
+            for slot in slots[gone].tolist():
+                self.release(slot)
+            for handle in set(self.target[slots[gone]].tolist()):
+                self.registry.get_target(handle)  # Releases the dead enemy
+            slots = slots[~gone]
+            targets = [target for target, dead in zip(targets, gone.tolist()) if not dead]
+            if len(slots) == 0:
+                return
+        target_pos = np.array([target.pos for target in targets], dtype=np.float64)
+        delta = target_pos - self.pos[slots]
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        step = self.speed[slots] * (dt * FPS)
+        hit = dist < step
+        flying = ~hit
+        self.pos[slots[flying]] += delta[flying] * (step[flying] / dist[flying])[:, None]
+        for i in np.flatnonzero(hit).tolist():
+            targets[i].health -= float(self.damage[slots[i]])
+            self.release(int(slots[i]))
+
+    def draw(self, screen: 'pygame.Surface') -> list['pygame.Rect']:
+        return [
+            pygame.draw.circle(screen, YELLOW, (int(x), int(y)), 2)
+            for x, y in self.pos[self.active].tolist()
+        ]
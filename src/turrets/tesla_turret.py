@@ -1,5 +1,11 @@
-import math
 import random
+
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
+
+from game.status_effects import StatusEffects
 from turrets.turret import Turret
 
 YELLOW = (255, 255, 0)
@@ -7,13 +13,17 @@ WHITE = (255, 255, 255)
 FPS = 60
 
 class TeslaTurret(Turret):
+    __slots__ = (
+        'max_targets', 'targets', 'lightning_color', 'lightning_width', 'spark_size', 'spark_spread',
+    )
+
     def __init__(self, x: int, y: int):
         super().__init__(x, y)
         self.damage = 10
         self.range = 120
         self.cost = 75
         self.max_targets = 5
-        self.targets = []
+        self.targets: set[int] = set()  # Registry handles of the enemies being zapped
         self.lightning_color = (255, 255, 100)
         self.lightning_width = 4
         self.spark_size = 4
@@ -26,41 +36,54 @@ class TeslaTurret(Turret):
         colors = [(255,255,0), (255,140,0), (255,0,0)]
         self.color = colors[min(self.upgrade_level, 2)]
 
-    def update(self, enemies: list):
-        # Remove dead or out-of-range targets
-        self.targets = [target for target in self.targets if 
-                       target.health > 0 and 
-                       math.sqrt((target.pos[0] - self.pos[0]) ** 2 + 
-                               (target.pos[1] - self.pos[1]) ** 2) <= self.range]
+    def update(self, enemies: list, dt: float = 1 / FPS):
+        # Remove dead or out-of-range targets; removed enemies no longer resolve
+        targets = []
+        live = set()
+        for handle in self.targets:
+            target = self.registry.get_target(handle)
+            if target is not None and self.in_range(target):
+                targets.append(target)
+                live.add(handle)
+        self.targets = live
         # Find new targets if we have room for more
         if len(self.targets) < self.max_targets:
-            for enemy in enemies:
-                if enemy not in self.targets:  # Don't target the same enemy twice
-                    dist = math.sqrt(
-                        (enemy.pos[0] - self.pos[0]) ** 2 + 
-                        (enemy.pos[1] - self.pos[1]) ** 2
-                    )
-                    if dist <= self.range:
-                        self.targets.append(enemy)
-                        if len(self.targets) >= self.max_targets:
-                            break
-        # Deal damage to all targets
-        for target in self.targets:
-            target.health -= self.damage / FPS  # Smooth damage per frame
+            for enemy in self.enemies_in_range(enemies):
+                if enemy.health <= 0:
+                    continue  # Killed earlier this tick, or left in a standalone caller's list
+                handle = self.registry.handle_of(enemy)
+                if handle not in self.targets:  # Don't target the same enemy twice
+                    self.targets.add(handle)
+                    targets.append(enemy)
+                    if len(self.targets) >= self.max_targets:
+                        break
+        # Deal damage to all targets, through a buffer of its own when standalone
+        effects = self.status_effects or StatusEffects()
+        for target in targets:
+            effects.add(target, 'dot', self.damage)
+        if effects is not self.status_effects:
+            effects.resolve([], dt)  # No slows, so no enemy's speed is touched
 
-    def draw(self, screen):
+    def live_targets(self) -> list:
+        return [target for target in map(self.registry.get, self.targets) if target is not None]
+
+    def is_idle(self) -> bool:
+        return not self.targets
+
+    def draw_body(self, surface, center):
         # Draw triangle for turret
         radius = self.radius
-        center = self.pos
         points = [
             (center[0], center[1] - radius),  # Top
             (center[0] - radius, center[1] + radius),  # Bottom left
             (center[0] + radius, center[1] + radius),  # Bottom right
         ]
-        pygame = __import__('pygame')
-        pygame.draw.polygon(screen, self.color, points)
+        return pygame.draw.polygon(surface, self.color, points)
+
+    def draw(self, screen):
+        rect = super().draw(screen)
         # Draw lightning effect for all targets
-        for target in self.targets:
+        for target in self.live_targets():
             start_pos = self.pos
             end_pos = target.pos
             dx = end_pos[0] - start_pos[0]
@@ -75,24 +98,31 @@ class TeslaTurret(Turret):
                 ]
                 points.append(point)
             points.append(end_pos)
-            pygame.draw.lines(screen, self.lightning_color, False, points, self.lightning_width)
+            rect.union_ip(
+                pygame.draw.lines(screen, self.lightning_color, False, points, self.lightning_width)
+            )
+        return rect
 
     def draw_effects(self, screen):
-        pygame = __import__('pygame')
-        for target in self.targets:
+        rect = pygame.Rect(self.pos, (0, 0))  # Empty while there are no sparks
+        for target in self.live_targets():
             end_pos = target.pos
             for _ in range(6):
                 spark_offset_x = random.randint(-self.spark_spread, self.spark_spread)
                 spark_offset_y = random.randint(-self.spark_spread, self.spark_spread)
                 spark_pos = (end_pos[0] + spark_offset_x, end_pos[1] + spark_offset_y)
-                pygame.draw.circle(screen, self.lightning_color, spark_pos, self.spark_size)
+                spark = pygame.draw.circle(screen, self.lightning_color, spark_pos, self.spark_size)
                 pygame.draw.circle(screen, WHITE, spark_pos, self.spark_size // 2)
+                rect = spark if rect.w == 0 else rect.union(spark)
+        return rect
 
     def upgrade(self):
         self.damage *= 2
         if self.upgrade_level < 2:
             self.upgrade_level += 1
         self.set_color()
+        self.sprite = None
+        self.update_coverage()
 
     def get_upgrade_cost(self):
         return 3 * self.cost * (self.upgrade_level + 1) 
\ No newline at end of file
@@ -3,9 +3,14 @@ import math
 import time
 import random
 
-import pygame
+try:
+    import pygame
+except ImportError:  # headless simulation runs without pygame installed
+    pygame = None
 
+from config import WIDTH
 from enemies.enemy import Enemy
+from game.entity_registry import EntityRegistry
 
 
 # Constants
@@ -15,62 +20,203 @@ YELLOW = (255, 255, 0)
 BLUE = (0, 0, 255)
 FPS = 60  # Added FPS constant
 
+COLORKEY = (255, 0, 255)  # Transparent corners of turret sprites
+
+# How a single-target turret picks among the enemies in range
+TARGETING = {
+    'first': (max, lambda enemy: enemy.distance),  # Furthest along the path
+    'last': (min, lambda enemy: enemy.distance),
+    'strongest': (max, lambda enemy: enemy.health),
+    'weakest': (min, lambda enemy: enemy.health),
+}
+
 
 class Projectile:
-    def __init__(self, x: int, y: int, target: Enemy, damage: int):
-        self.pos = [x, y]
-        self.target = target
+    __slots__ = ('x', 'y', 'target', 'speed', 'damage', 'active', 'assigner', 'registry', 'handle')
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        target: Enemy,
+        damage: int,
+        registry: EntityRegistry,
+        assigner: 'TargetAssigner' = None,
+    ):
+        self.x = x
+        self.y = y
+        self.registry = registry
+        self.target = registry.handle_of(target)  # Stops resolving once the enemy is removed
         self.speed = 10
         self.damage = damage
         self.active = True
-
-    def move(self):
-        if not self.target:
-            self.active = False
+        self.assigner = assigner  # Holds this projectile's damage reservation
+        self.handle = registry.register(self)
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        return self.x, self.y
+
+    def move(self, dt: float = 1 / FPS):
+        target = self.registry.get(self.target)
+        if target is None or target.health <= 0 or target.reached_end:
+            # Target already gone: retire now instead of flying on for nothing
+            self.retire()
+            self.registry.get_target(self.target)  # Releases the dead enemy
             return
-        dx, dy = self.target.pos[0] - self.pos[0], self.target.pos[1] - self.pos[1]
+        # Speed is expressed in pixels per frame at the reference FPS
+        step = self.speed * dt * FPS
+        dx, dy = target.pos[0] - self.x, target.pos[1] - self.y
         dist = math.sqrt(dx**2 + dy**2)
-        if dist < self.speed:
-            self.active = False
-            self.target.health -= self.damage
+        if dist < step:
+            target.health -= self.damage
+            self.retire()
         else:
-            self.pos[0] += self.speed * dx / dist
-            self.pos[1] += self.speed * dy / dist
+            self.x += step * dx / dist
+            self.y += step * dy / dist
+
+    def retire(self):
+        self.active = False
+        target = self.registry.get(self.target)
+        if self.assigner is not None and target is not None:
+            self.assigner.release(target, self.damage)
+        self.registry.release(self.handle)
 
-    def draw(self, screen):
-        pygame.draw.circle(screen, YELLOW, (int(self.pos[0]), int(self.pos[1])), 2)
+    def draw(self, screen) -> 'pygame.Rect':
+        return pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), 2)
 
 
 class Turret(ABC):
+    __slots__ = (
+        'pos', 'base_radius', 'base_range', 'radius', 'range', 'path', 'coverage',
+        'projectile_system', 'status_effects', 'color', 'cost', 'upgrade_level', 'damage',
+        'targeting', 'target_assigner', 'registry', 'handle', 'sprite',
+    )
+
     def __init__(self, x: int, y: int):
         self.pos = [x, y]
         self.base_radius = 15
         self.base_range = 100
+        self.path = None
+        self.coverage: list[tuple[float, float]] = []  # Arc-length intervals of the path in range
+        # Shared projectile storage owned by the simulation; None keeps a per-turret list
+        self.projectile_system = None
+        # Shared status-effect buffer; None resolves a per-update buffer of the turret's own
+        self.status_effects = None
+        self.targeting = 'first'  # One of TARGETING
+        # Shared damage reservations; None lets turrets overkill
+        self.target_assigner = None
+        # Handles for targets and projectiles; the simulation replaces this with
+        # the registry everything in it shares
+        self.registry = EntityRegistry()
+        self.handle: int | None = None
+        self.sprite = None  # (surface, offset) from the sprite cache, set on first draw
         self.update_dimensions()
         self.color = BLACK
         self.cost = 50  # Base cost for turrets
         self.upgrade_level = 0
 
     def update_dimensions(self):
-        width, height = pygame.display.get_surface().get_size()
+        # Headless simulations have no display, so fall back to the design width
+        surface = pygame.display.get_surface() if pygame is not None else None
+        width = surface.get_width() if surface is not None else WIDTH
         scale = width / 800
         self.radius = int(self.base_radius * scale)
         self.range = int(self.base_range * scale)
+        self.sprite = None
+        self.update_coverage()
 
     def scale_position(self, width_ratio: float, height_ratio: float):
         self.pos[0] = int(self.pos[0] * width_ratio)
         self.pos[1] = int(self.pos[1] * height_ratio)
+        self.update_coverage()
+
+    def set_path(self, path: 'ArcPath'):
+        self.path = path
+        self.update_coverage()
+
+    def update_coverage(self):
+        # Turrets never move on their own, so the reachable stretch of road
+        # only changes when the path, position or range does
+        if self.path is not None:
+            self.coverage = self.path.coverage(self.pos[0], self.pos[1], self.range)
 
     def get_upgrade_cost(self):
         return int(self.cost * 3 * (self.upgrade_level + 1))
 
+    def enemies_in_range(self, enemies) -> list:
+        # Prefer a per-tick index (e.g. SpatialHash) when the caller passes one
+        if hasattr(enemies, 'in_range'):
+            return enemies.in_range(self)
+        x, y = self.pos
+        range2 = self.range ** 2
+        return [
+            enemy for enemy in enemies
+            if (enemy.pos[0] - x) ** 2 + (enemy.pos[1] - y) ** 2 <= range2
+        ]
+
+    def select_target(self, enemies):
+        # A ProgressIndex answers from its sorted order and health tables; otherwise
+        # scan the enemies in range
+        skip = self.target_assigner.is_doomed if self.target_assigner is not None else None
+        if hasattr(enemies, 'select'):
+            return enemies.select(self, self.targeting, skip)
+        candidates = self.enemies_in_range(enemies)
+        if skip is not None:
+            candidates = [enemy for enemy in candidates if not skip(enemy)]
+        if not candidates:
+            return None
+        pick, key = TARGETING[self.targeting]
+        return pick(candidates, key=key)
+
+    def in_range(self, enemy) -> bool:
+        x, y = enemy.pos
+        return (x - self.pos[0]) ** 2 + (y - self.pos[1]) ** 2 <= self.range ** 2
+
+    def is_idle(self) -> bool:
+        # True when skipping update() changes nothing until an enemy is in range
+        return True
+
     @abstractmethod
     def upgrade(self):
         pass
 
     @abstractmethod
-    def update(self, enemies: list[Enemy]):
+    def update(self, enemies: list[Enemy], dt: float = 1 / FPS):
         pass
 
-    def draw(self, screen: pygame.Surface):
-        pygame.draw.circle(screen, self.color, self.pos, self.radius)
+    def draw_body(self, surface: 'pygame.Surface', center: tuple[int, int]) -> 'pygame.Rect':
+        # The turret's shape; rendered once per (class, level, radius) into the sprite cache
+        return pygame.draw.circle(surface, self.color, center, self.radius)
+
+    def draw(self, screen: 'pygame.Surface') -> 'pygame.Rect':
+        if self.sprite is None:
+            self.sprite = turret_sprite(self)
+        image, (dx, dy) = self.sprite
+        return screen.blit(image, (self.pos[0] + dx, self.pos[1] + dy))
+
+
+_sprites: dict[tuple[type, int, int], tuple['pygame.Surface', tuple[int, int]]] = {}
+
+
+def turret_sprite(turret: Turret) -> tuple['pygame.Surface', tuple[int, int]]:
+    """Cached body sprite for the turret's class, upgrade level and radius.
+
+    Returns the surface and its offset from the turret's centre. The body is
+    drawn with the turret's own ``draw_body`` and cropped to the pixels it
+    touched, so blitting it matches drawing the shape directly.
+    """
+    key = (type(turret), turret.upgrade_level, turret.radius)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        size = 2 * turret.radius + 4
+        center = (size // 2, size // 2)
+        canvas = pygame.Surface((size, size))
+        canvas.fill(COLORKEY)
+        touched = turret.draw_body(canvas, center).clip(canvas.get_rect())
+        image = canvas.subsurface(touched).copy()
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        image.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        sprite = _sprites[key] = (image, (touched.x - center[0], touched.y - center[1]))
+    return sprite